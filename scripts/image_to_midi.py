@@ -11,23 +11,20 @@ License: MIT (same as Jazz Architect project)
 
 import sys
 import os
+import atexit
+import importlib.util
 import tempfile
 import subprocess
 import json
 from pathlib import Path
+from typing import Optional
 
 def check_dependencies():
-    """Check if required packages are installed"""
-    missing = []
-    try:
-        import oemer
-    except ImportError:
-        missing.append("oemer")
-
-    try:
-        import music21
-    except ImportError:
-        missing.append("music21")
+    """Check if required packages are installed (without importing them)"""
+    missing = [
+        name for name in ("oemer", "music21")
+        if importlib.util.find_spec(name) is None
+    ]
 
     if missing:
         print(f"Error: Missing packages: {', '.join(missing)}", file=sys.stderr)
@@ -35,14 +32,98 @@ def check_dependencies():
         return False
     return True
 
-def run_oemer(image_path: str, output_dir: str) -> str:
+class OemerWorker:
     """
-    Run oemer CLI to convert image to MusicXML
+    Long-running oemer process (scripts/oemer_worker.py)
+    Pays the oemer import/runtime startup cost once for a batch of images
+    """
+
+    def __init__(self):
+        self._proc = None
+
+    def start(self):
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        worker_path = Path(__file__).with_name("oemer_worker.py")
+        self._proc = subprocess.Popen(
+            [sys.executable, str(worker_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+    def convert(self, image_path: str, output_dir: str) -> Optional[str]:
+        """Convert one image, returns path reported by the worker (None if unknown)"""
+        self.start()
+        request = {"image": image_path, "out_dir": output_dir}
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.flush()
+
+        line = self._proc.stdout.readline()
+        if not line:
+            self._proc = None
+            raise RuntimeError("oemer worker exited unexpectedly")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(f"oemer failed: {response['error']}")
+        return response["musicxml_path"]
+
+    def close(self):
+        if self._proc is None:
+            return
+        self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+        self._proc = None
+
+_oemer_worker = None
+
+def get_oemer_worker() -> OemerWorker:
+    """Get the session-global oemer worker, starting it lazily"""
+    global _oemer_worker
+    if _oemer_worker is None:
+        _oemer_worker = OemerWorker()
+        atexit.register(_oemer_worker.close)
+    return _oemer_worker
+
+def _find_musicxml(image_path: str, output_dir: str) -> str:
+    """Locate the MusicXML file oemer wrote for an image"""
+    base_name = Path(image_path).stem
+    xml_path = os.path.join(output_dir, f"{base_name}.musicxml")
+
+    if not os.path.exists(xml_path):
+        # Try alternative naming
+        for f in os.listdir(output_dir):
+            if f.endswith('.musicxml'):
+                xml_path = os.path.join(output_dir, f)
+                break
+
+    if not os.path.exists(xml_path):
+        raise RuntimeError("MusicXML file not generated")
+
+    return xml_path
+
+def run_oemer(image_path: str, output_dir: str, use_worker: bool = False) -> str:
+    """
+    Run oemer to convert image to MusicXML
+    Single-shot calls use the oemer CLI; batch callers should pass
+    use_worker=True to reuse one persistent oemer process
     Returns path to generated MusicXML file
     """
     print(f"Processing image: {image_path}", file=sys.stderr)
 
     try:
+        if use_worker:
+            xml_path = get_oemer_worker().convert(image_path, output_dir)
+            if not xml_path or not os.path.exists(xml_path):
+                xml_path = _find_musicxml(image_path, output_dir)
+            print(f"MusicXML saved: {xml_path}", file=sys.stderr)
+            return xml_path
+
         # Find oemer in the same directory as this Python interpreter
         python_dir = Path(sys.executable).parent
         oemer_path = python_dir / "oemer"
@@ -53,31 +134,23 @@ def run_oemer(image_path: str, output_dir: str) -> str:
         else:
             oemer_cmd = [str(oemer_path)]
 
-        # Run oemer
+        # Run oemer; stdout is never read, stderr is only decoded on failure
         result = subprocess.run(
             oemer_cmd + ["-o", output_dir, image_path],
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
             timeout=600  # 10 minutes max
         )
 
         if result.returncode != 0:
-            print(f"oemer stderr: {result.stderr}", file=sys.stderr)
-            raise RuntimeError(f"oemer failed: {result.stderr}")
+            stderr = result.stderr.decode(errors='replace')
+            print(f"oemer stderr: {stderr}", file=sys.stderr)
+            raise RuntimeError(f"oemer failed: {stderr}")
 
         # Find generated MusicXML file
-        base_name = Path(image_path).stem
-        xml_path = os.path.join(output_dir, f"{base_name}.musicxml")
-
-        if not os.path.exists(xml_path):
-            # Try alternative naming
-            for f in os.listdir(output_dir):
-                if f.endswith('.musicxml'):
-                    xml_path = os.path.join(output_dir, f)
-                    break
-
-        if not os.path.exists(xml_path):
-            raise RuntimeError("MusicXML file not generated")
+        xml_path = _find_musicxml(image_path, output_dir)
 
         print(f"MusicXML saved: {xml_path}", file=sys.stderr)
         return xml_path
@@ -88,17 +161,24 @@ def run_oemer(image_path: str, output_dir: str) -> str:
         print(f"oemer error: {e}", file=sys.stderr)
         raise
 
-def musicxml_to_midi(xml_path: str, midi_path: str) -> bool:
+def musicxml_to_midi(xml_path: str, midi_path: str):
     """
     Convert MusicXML to MIDI using music21
+    Returns the parsed score (None on failure) so callers can reuse it
     """
     try:
         from music21 import converter, midi
 
         print(f"Converting to MIDI: {midi_path}", file=sys.stderr)
 
-        # Parse MusicXML
-        score = converter.parse(xml_path)
+        # Parse MusicXML straight from source: oemer output lives in a temp
+        # dir, so skip format sniffing and the pickle cache lookup/write
+        score = converter.parse(
+            xml_path,
+            format='musicxml',
+            forceSource=True,
+            storePickle=False
+        )
 
         # Write MIDI
         mf = midi.translate.music21ObjectToMidiFile(score)
@@ -107,42 +187,118 @@ def musicxml_to_midi(xml_path: str, midi_path: str) -> bool:
         mf.close()
 
         print(f"MIDI saved: {midi_path}", file=sys.stderr)
-        return True
+        return score
 
     except Exception as e:
         print(f"music21 error: {e}", file=sys.stderr)
-        return False
+        return None
+
+def _extract_chords_symusic(symusic, midi_path: str) -> list:
+    """
+    Fast MIDI readback using symusic (C++ backend)
+    Notes starting within 1/16 of a quarter are grouped into one chord event
+    """
+    score = symusic.Score(midi_path)
+    tpq = score.ticks_per_quarter
+    window = max(1, tpq // 16)
+
+    notes = sorted(
+        (n for track in score.tracks if not track.is_drum for n in track.notes),
+        key=lambda n: (n.time, n.pitch)
+    )
+
+    chords = []
+    group = []
+
+    def flush():
+        pitches = [n.pitch for n in group]
+        chords.append({
+            "offset": group[0].time / tpq,
+            "duration": max(n.duration for n in group) / tpq,
+            "pitches": pitches,
+            "root": min(pitches)
+        })
+
+    for n in notes:
+        if group and n.time - group[0].time >= window:
+            flush()
+            group = []
+        group.append(n)
+    if group:
+        flush()
+
+    return chords
+
+def _extract_chords_music21(midi_path: str) -> list:
+    """
+    MIDI readback using music21
+    """
+    from music21 import converter
+
+    # The MIDI file was just written, so never trust a cached pickle;
+    # keep raw durations and skip measure/notation construction
+    score = converter.parse(
+        midi_path,
+        forceSource=True,
+        quantizePost=False,
+        makeNotation=False
+    )
+    return _chords_from_score(score)
+
+def _chords_from_score(score) -> list:
+    """
+    Collect chord events from a music21 score, ordered by offset
+    """
+    events = []
+
+    # recurse() walks the hierarchy lazily instead of building .flat (whose
+    # purgeOrphans pass is O(n^2)); class-filtered iterators replace the
+    # per-element isinstance dispatch
+    for element in score.recurse().getElementsByClass('Chord'):
+        root = element.root()
+        events.append({
+            "offset": float(element.getOffsetInHierarchy(score)),
+            "duration": float(element.duration.quarterLength),
+            "pitches": [p.midi for p in element.pitches],
+            "root": root.midi if root else None
+        })
+
+    for element in score.recurse().getElementsByClass('Note'):
+        midi_pitch = element.pitch.midi
+        events.append({
+            "offset": float(element.getOffsetInHierarchy(score)),
+            "duration": float(element.duration.quarterLength),
+            "pitches": [midi_pitch],
+            "root": midi_pitch
+        })
+
+    events.sort(key=lambda e: e["offset"])
+    return events
+
+def extract_chords_from_score(score) -> list:
+    """
+    Extract chord information from an in-memory music21 score
+    Avoids writing and re-parsing a MIDI file when the score is at hand
+    """
+    try:
+        return _chords_from_score(score)
+
+    except Exception as e:
+        print(f"Chord extraction error: {e}", file=sys.stderr)
+        return []
 
 def extract_chords_from_midi(midi_path: str) -> list:
     """
     Extract chord information from MIDI for Jazz Architect
     Returns list of chord events with timing
+    Uses symusic when installed, otherwise falls back to music21
     """
     try:
-        from music21 import converter, chord, note
-
-        score = converter.parse(midi_path)
-        chords = []
-
-        for element in score.flat.notes:
-            if isinstance(element, chord.Chord):
-                chord_info = {
-                    "offset": float(element.offset),
-                    "duration": float(element.duration.quarterLength),
-                    "pitches": [p.midi for p in element.pitches],
-                    "root": element.root().midi if element.root() else None
-                }
-                chords.append(chord_info)
-            elif isinstance(element, note.Note):
-                note_info = {
-                    "offset": float(element.offset),
-                    "duration": float(element.duration.quarterLength),
-                    "pitches": [element.pitch.midi],
-                    "root": element.pitch.midi
-                }
-                chords.append(note_info)
-
-        return chords
+        try:
+            import symusic
+        except ImportError:
+            return _extract_chords_music21(midi_path)
+        return _extract_chords_symusic(symusic, midi_path)
 
     except Exception as e:
         print(f"Chord extraction error: {e}", file=sys.stderr)
@@ -155,7 +311,7 @@ def main():
         print("Converts sheet music image to MIDI file")
         print("Supported formats: PNG, JPG, JPEG")
         print("")
-        print("Requirements: oemer, music21")
+        print("Requirements: oemer, music21 (optional: symusic)")
         sys.exit(0 if '--help' in sys.argv or '-h' in sys.argv else 1)
 
     input_image = sys.argv[1]
@@ -183,9 +339,10 @@ def main():
             xml_path = run_oemer(input_image, temp_dir)
 
             # Step 2: MusicXML -> MIDI (music21)
-            if musicxml_to_midi(xml_path, output_midi):
-                # Step 3: Extract chord info for Jazz Architect
-                chords = extract_chords_from_midi(output_midi)
+            score = musicxml_to_midi(xml_path, output_midi)
+            if score is not None:
+                # Step 3: Extract chord info from the in-memory score
+                chords = extract_chords_from_score(score)
 
                 # Output result as JSON
                 result = {
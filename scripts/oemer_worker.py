@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Persistent oemer worker for Jazz Architect
+Imports oemer (and its inference runtime) once, then serves conversion
+requests as JSON lines on stdin/stdout
+
+Protocol:
+    request:  {"image": "<path>", "out_dir": "<dir>"}
+    response: {"musicxml_path": "<path>"} or {"error": "<message>"}
+
+License: MIT (same as Jazz Architect project)
+"""
+
+import os
+import sys
+import json
+from argparse import Namespace
+
+def main():
+    # Responses own the original stdout; point fd 1 at stderr so progress
+    # output from oemer and any native library can't corrupt the protocol
+    sys.stdout.flush()
+    out = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    from oemer import ete
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            args = Namespace(
+                img_path=request["image"],
+                output_path=request["out_dir"],
+                use_tf=False,
+                save_cache=False,
+                without_deskew=False,
+            )
+            xml_path = ete.extract(args)
+            response = {"musicxml_path": str(xml_path) if xml_path else None}
+        except Exception as e:
+            response = {"error": str(e)}
+        finally:
+            # Drop layers registered by this image before the next one
+            ete.clear_data()
+
+        out.write(json.dumps(response) + "\n")
+        out.flush()
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 """ChordSymbol - jazz chord representation with quality and extensions"""
 
 from __future__ import annotations
-from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+import functools
+import re
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
-from .pitch import PitchClass
+from .pitch import PitchClass, _PC_CACHE, _pc_transpose
 
 
 class ChordQuality(Enum):
@@ -25,7 +27,7 @@ class ChordQuality(Enum):
     @property
     def intervals(self) -> Tuple[int, ...]:
         """Return intervals from root in semitones"""
-        return _QUALITY_INTERVALS[self]
+        return _INTERVALS_BY_ORDINAL[self._ord]
 
 
 _QUALITY_INTERVALS: Dict[ChordQuality, Tuple[int, ...]] = {
@@ -42,23 +44,92 @@ _QUALITY_INTERVALS: Dict[ChordQuality, Tuple[int, ...]] = {
     ChordQuality.SUS2: (0, 2, 7, 10),
 }
 
+# Flat ordinal-indexed tables; each member also caches its guide-tone
+# intervals so ChordSymbol.third/fifth/seventh are single attribute reads
+_INTERVALS_BY_ORDINAL: Tuple[Tuple[int, ...], ...] = tuple(
+    _QUALITY_INTERVALS[q] for q in ChordQuality
+)
+
+for _ord, _quality in enumerate(ChordQuality):
+    _intervals = _INTERVALS_BY_ORDINAL[_ord]
+    _quality._ord = _ord
+    _quality._third = _intervals[1] if len(_intervals) > 1 else 4
+    _quality._fifth = _intervals[2] if len(_intervals) > 2 else 7
+    _quality._seventh = _intervals[3] if len(_intervals) > 3 else None
+del _ord, _quality, _intervals
+
+# Chord-tone pitch classes for every (quality ordinal, root) pair
+_CHORD_TONE_TABLE: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple((root + i) % 12 for i in intervals) for root in range(12))
+    for intervals in _INTERVALS_BY_ORDINAL
+)
+
+
+def pitch_classes_batch(
+    roots: Sequence[int],
+    qualities: Sequence[ChordQuality]
+) -> List[Tuple[int, ...]]:
+    """Expand many (root, quality) pairs to chord-tone pitch classes at once.
+
+    Extensions are not included; use ChordSymbol.get_pitch_classes for those.
+    """
+    table = _CHORD_TONE_TABLE
+    return [table[q._ord][r % 12] for r, q in zip(roots, qualities)]
+
 
-@dataclass
 class ChordSymbol:
     """Represents a jazz chord symbol with root, quality, extensions, and alterations.
 
+    Instances are immutable: extensions are stored as a sorted tuple and
+    alterations as a read-only mapping, and the hash is computed once.
+
     Examples:
         Cmaj7, Dm7, G7, Am7b5, Bb7#11, F#m7b5
     """
+
+    __slots__ = ('root', 'quality', 'extensions', 'alterations', 'bass',
+                 '_alterations_sorted', '_hash')
+
     root: PitchClass
     quality: ChordQuality
-    extensions: List[int] = field(default_factory=list)
-    alterations: Dict[str, str] = field(default_factory=dict)
-    bass: Optional[PitchClass] = None  # For slash chords
-
-    def __post_init__(self):
-        # Ensure extensions are sorted
-        self.extensions = sorted(set(self.extensions))
+    extensions: Tuple[int, ...]
+    alterations: Mapping[str, str]
+    bass: Optional[PitchClass]  # For slash chords
+
+    def __init__(
+        self,
+        root: PitchClass,
+        quality: ChordQuality,
+        extensions: Sequence[int] = (),
+        alterations: Optional[Mapping[str, str]] = None,
+        bass: Optional[PitchClass] = None
+    ):
+        # Ensure extensions are sorted, freeze the containers
+        extensions = tuple(sorted(set(extensions)))
+        alterations = MappingProxyType(dict(alterations) if alterations else {})
+        alterations_sorted = tuple(sorted(alterations.items()))
+
+        setattr_ = object.__setattr__
+        setattr_(self, 'root', root)
+        setattr_(self, 'quality', quality)
+        setattr_(self, 'extensions', extensions)
+        setattr_(self, 'alterations', alterations)
+        setattr_(self, 'bass', bass)
+        setattr_(self, '_alterations_sorted', alterations_sorted)
+        # Hash on plain ints rather than PitchClass/Enum objects
+        setattr_(self, '_hash', hash((
+            root._value, quality._ord, extensions, alterations_sorted
+        )))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ChordSymbol is immutable, cannot set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ChordSymbol is immutable, cannot delete '{name}'")
+
+    def __reduce__(self):
+        return (ChordSymbol, (self.root, self.quality, self.extensions,
+                              dict(self.alterations), self.bass))
 
     @classmethod
     def from_string(cls, symbol: str) -> ChordSymbol:
@@ -68,34 +139,32 @@ class ChordSymbol:
     @property
     def third(self) -> PitchClass:
         """Get the third of the chord (guide tone)"""
-        intervals = self.quality.intervals
-        third_interval = intervals[1] if len(intervals) > 1 else 4
-        return self.root.transpose(third_interval)
+        return _PC_CACHE[_pc_transpose(self.root._value, self.quality._third)]
 
     @property
     def seventh(self) -> Optional[PitchClass]:
         """Get the seventh of the chord (guide tone), None if no 7th"""
-        intervals = self.quality.intervals
-        if len(intervals) < 4:
+        seventh_interval = self.quality._seventh
+        if seventh_interval is None:
             return None
-        return self.root.transpose(intervals[3])
+        return _PC_CACHE[_pc_transpose(self.root._value, seventh_interval)]
 
     @property
     def fifth(self) -> PitchClass:
         """Get the fifth of the chord"""
-        intervals = self.quality.intervals
-        fifth_interval = intervals[2] if len(intervals) > 2 else 7
+        fifth_interval = self.quality._fifth
         # Apply alterations
         if '5' in self.alterations:
             if self.alterations['5'] == 'b':
                 fifth_interval = 6
             elif self.alterations['5'] == '#':
                 fifth_interval = 8
-        return self.root.transpose(fifth_interval)
+        return _PC_CACHE[_pc_transpose(self.root._value, fifth_interval)]
 
     def get_pitch_classes(self) -> List[PitchClass]:
         """Get all pitch classes in the chord including extensions"""
-        pitches = [self.root.transpose(i) for i in self.quality.intervals]
+        root = self.root._value
+        pitches = list(_CHORD_TONE_TABLE[self.quality._ord][root])
 
         # Add extensions
         extension_intervals = {
@@ -106,39 +175,52 @@ class ChordSymbol:
 
         for ext in self.extensions:
             if ext in extension_intervals:
-                pitches.append(self.root.transpose(extension_intervals[ext]))
+                pitches.append(_pc_transpose(root, extension_intervals[ext]))
 
-        return pitches
+        return [_PC_CACHE[pc] for pc in pitches]
 
-    def transpose(self, semitones: int) -> ChordSymbol:
-        """Return new ChordSymbol transposed by given semitones"""
-        new_bass = self.bass.transpose(semitones) if self.bass else None
+    def with_alterations(self, alterations: Mapping[str, str]) -> ChordSymbol:
+        """Return new ChordSymbol with the given alterations merged in"""
         return ChordSymbol(
-            root=self.root.transpose(semitones),
+            root=self.root,
             quality=self.quality,
-            extensions=self.extensions.copy(),
-            alterations=self.alterations.copy(),
-            bass=new_bass
+            extensions=self.extensions,
+            alterations={**self.alterations, **alterations},
+            bass=self.bass
         )
 
+    def _with_root(self, root: PitchClass, bass: Optional[PitchClass]) -> ChordSymbol:
+        """Build a copy with a new root/bass, sharing the immutable containers"""
+        chord = object.__new__(ChordSymbol)
+        setattr_ = object.__setattr__
+        setattr_(chord, 'root', root)
+        setattr_(chord, 'quality', self.quality)
+        setattr_(chord, 'extensions', self.extensions)
+        setattr_(chord, 'alterations', self.alterations)
+        setattr_(chord, 'bass', bass)
+        setattr_(chord, '_alterations_sorted', self._alterations_sorted)
+        setattr_(chord, '_hash', hash((
+            root._value, self.quality._ord, self.extensions,
+            self._alterations_sorted
+        )))
+        return chord
+
+    def transpose(self, semitones: int) -> ChordSymbol:
+        """Return new ChordSymbol transposed by given semitones"""
+        new_bass = self.bass.transpose(semitones) if self.bass else None
+        return self._with_root(self.root.transpose(semitones), new_bass)
+
     def tritone_substitute(self) -> ChordSymbol:
         """Return tritone substitution of this chord (for dominant chords)"""
-        return ChordSymbol(
-            root=self.root.transpose(6),
-            quality=self.quality,
-            extensions=self.extensions.copy(),
-            alterations=self.alterations.copy()
-        )
+        return self._with_root(self.root.transpose(6), None)
 
     def as_roman_numeral(self, key: PitchClass) -> str:
         """Return Roman numeral representation relative to key"""
-        interval = key.interval_to(self.root)
-        numerals = ['I', 'bII', 'II', 'bIII', 'III', 'IV', '#IV', 'V', 'bVI', 'VI', 'bVII', 'VII']
-        base = numerals[interval]
+        base = _ROMAN_NUMERALS[(self.root._value - key._value) % 12]
 
         # Lowercase for minor qualities
-        if self.quality in (ChordQuality.MIN7, ChordQuality.HDIM7, ChordQuality.MIN6, ChordQuality.MIN_MAJ7):
-            base = base.lower()
+        if self.quality in _MINOR_QUALITIES:
+            return base.lower() + self.quality.value
 
         return base + self.quality.value
 
@@ -146,7 +228,7 @@ class ChordSymbol:
         result = str(self.root) + self.quality.value
 
         # Add alterations
-        for degree, alt in sorted(self.alterations.items()):
+        for degree, alt in self._alterations_sorted:
             result += alt + degree
 
         # Add extensions
@@ -166,45 +248,27 @@ class ChordSymbol:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ChordSymbol):
             return NotImplemented
-        return (self.root == other.root and
-                self.quality == other.quality and
+        return (self.root._value == other.root._value and
+                self.quality._ord == other.quality._ord and
                 self.extensions == other.extensions and
                 self.alterations == other.alterations)
 
     def __hash__(self) -> int:
-        return hash((self.root, self.quality, tuple(self.extensions),
-                     tuple(sorted(self.alterations.items()))))
+        return self._hash
 
 
-def _parse_chord_symbol(symbol: str) -> ChordSymbol:
-    """Parse a chord symbol string into ChordSymbol object"""
-    import re
+_ROMAN_NUMERALS = ('I', 'bII', 'II', 'bIII', 'III', 'IV', '#IV', 'V', 'bVI', 'VI', 'bVII', 'VII')
 
-    symbol = symbol.strip()
-    if not symbol:
-        raise ValueError("Empty chord symbol")
+_MINOR_QUALITIES = frozenset({
+    ChordQuality.MIN7, ChordQuality.HDIM7, ChordQuality.MIN6, ChordQuality.MIN_MAJ7
+})
 
-    # Extract root note
-    root_match = re.match(r'^([A-G][#b]?)', symbol)
-    if not root_match:
-        raise ValueError(f"Invalid chord symbol: {symbol}")
-
-    root_str = root_match.group(1)
-    root = PitchClass.from_name(root_str)
-    remainder = symbol[len(root_str):]
-
-    # Check for slash chord
-    bass = None
-    if '/' in remainder:
-        parts = remainder.split('/')
-        remainder = parts[0]
-        if len(parts) > 1 and parts[1]:
-            bass = PitchClass.from_name(parts[1])
 
-    # Determine quality
-    quality = ChordQuality.DOM7  # Default
+_ROOT_RE = re.compile(r'^([A-G][#b]?)')
+_EXT_RE = re.compile(r'([b#]?)(9|11|13)')
 
-    quality_patterns = [
+_QUALITY_PATTERNS: Tuple[Tuple[re.Pattern, ChordQuality], ...] = tuple(
+    (re.compile(pattern), quality) for pattern, quality in sorted([
         (r'^maj7', ChordQuality.MAJ7),
         (r'^Maj7', ChordQuality.MAJ7),
         (r'^M7', ChordQuality.MAJ7),
@@ -226,10 +290,89 @@ def _parse_chord_symbol(symbol: str) -> ChordSymbol:
         (r'^sus4', ChordQuality.SUS4),
         (r'^sus2', ChordQuality.SUS2),
         (r'^7', ChordQuality.DOM7),
-    ]
+    ], key=lambda entry: -len(entry[0]))
+)
+
+# Longest-first candidates bucketed by the suffix's first character, so a
+# suffix only runs the handful of patterns that could possibly match
+_QUALITY_PATTERNS_BY_INITIAL: Dict[str, Tuple[Tuple[re.Pattern, ChordQuality], ...]] = {}
+for _entry in _QUALITY_PATTERNS:
+    _initial = _entry[0].pattern.lstrip('^').lstrip('\\')[0]
+    _QUALITY_PATTERNS_BY_INITIAL[_initial] = (
+        _QUALITY_PATTERNS_BY_INITIAL.get(_initial, ()) + (_entry,)
+    )
+del _entry, _initial
+
+# Quality suffixes that leave nothing for the extension/alteration parser,
+# resolved by a single dict lookup (the empty suffix keeps the DOM7 default)
+_SIMPLE_QUALITIES: Dict[str, ChordQuality] = {
+    '': ChordQuality.DOM7,
+    '7': ChordQuality.DOM7,
+    'maj7': ChordQuality.MAJ7,
+    'Maj7': ChordQuality.MAJ7,
+    'M7': ChordQuality.MAJ7,
+    'Δ': ChordQuality.MAJ7,
+    'Δ7': ChordQuality.MAJ7,
+    'mMaj7': ChordQuality.MIN_MAJ7,
+    'm7b5': ChordQuality.HDIM7,
+    'm7-5': ChordQuality.HDIM7,
+    'ø': ChordQuality.HDIM7,
+    'ø7': ChordQuality.HDIM7,
+    'dim7': ChordQuality.DIM7,
+    'o7': ChordQuality.DIM7,
+    'm7': ChordQuality.MIN7,
+    'min7': ChordQuality.MIN7,
+    '-7': ChordQuality.MIN7,
+    'm6': ChordQuality.MIN6,
+    'min6': ChordQuality.MIN6,
+    '6': ChordQuality.MAJ6,
+    'aug': ChordQuality.AUG,
+    '+': ChordQuality.AUG,
+    'sus4': ChordQuality.SUS4,
+    'sus2': ChordQuality.SUS2,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_chord_symbol(symbol: str) -> ChordSymbol:
+    """Parse a chord symbol string into ChordSymbol object.
+
+    Results are memoized since progressions reuse a small vocabulary of
+    chord symbols; ChordSymbol is immutable so cached instances are shared.
+    """
+    symbol = symbol.strip()
+    if not symbol:
+        raise ValueError("Empty chord symbol")
+
+    # Fast path: bare root + plain quality suffix needs no regex
+    if symbol[0] in 'ABCDEFG':
+        root_len = 2 if symbol[1:2] in ('#', 'b') else 1
+        quality = _SIMPLE_QUALITIES.get(symbol[root_len:])
+        if quality is not None:
+            return ChordSymbol(PitchClass.from_name(symbol[:root_len]), quality)
+
+    # Extract root note
+    root_match = _ROOT_RE.match(symbol)
+    if not root_match:
+        raise ValueError(f"Invalid chord symbol: {symbol}")
 
-    for pattern, q in quality_patterns:
-        match = re.match(pattern, remainder)
+    root_str = root_match.group(1)
+    root = PitchClass.from_name(root_str)
+    remainder = symbol[len(root_str):]
+
+    # Check for slash chord
+    bass = None
+    if '/' in remainder:
+        parts = remainder.split('/')
+        remainder = parts[0]
+        if len(parts) > 1 and parts[1]:
+            bass = PitchClass.from_name(parts[1])
+
+    # Determine quality
+    quality = ChordQuality.DOM7  # Default
+
+    for pattern, q in _QUALITY_PATTERNS_BY_INITIAL.get(remainder[:1], ()):
+        match = pattern.match(remainder)
         if match:
             quality = q
             remainder = remainder[match.end():]
@@ -239,8 +382,7 @@ def _parse_chord_symbol(symbol: str) -> ChordSymbol:
     extensions = []
     alterations = {}
 
-    ext_pattern = r'([b#]?)(9|11|13)'
-    for match in re.finditer(ext_pattern, remainder):
+    for match in _EXT_RE.finditer(remainder):
         alt, degree = match.groups()
         if alt:
             alterations[degree] = alt
@@ -261,6 +403,11 @@ def _parse_chord_symbol(symbol: str) -> ChordSymbol:
     )
 
 
+def clear_chord_cache():
+    """Clear the memoized chord symbol parse results"""
+    _parse_chord_symbol.cache_clear()
+
+
 # Common chord factory functions
 def maj7(root: str) -> ChordSymbol:
     return ChordSymbol(PitchClass.from_name(root), ChordQuality.MAJ7)
@@ -41,6 +41,20 @@ class PitchClass:
     def from_name(cls, name: str) -> PitchClass:
         """Create PitchClass from note name (e.g., 'C', 'F#', 'Bb')"""
         name = name.strip()
+        n = len(name)
+        if n == 1 or n == 2:
+            letter = ord(name[0]) - 65
+            if 0 <= letter < 7:
+                if n == 1:
+                    mod = 0
+                else:
+                    acc = name[1]
+                    mod = 1 if acc == '#' else (2 if acc == 'b' else 3)
+                value = _NAME_TABLE[(letter << 2) | mod]
+                if value >= 0:
+                    return cls(value, spelling=name)
+
+        # Slow path for anything outside the letter + accidental shape
         if name not in cls._NAME_TO_VALUE:
             raise ValueError(f"Unknown pitch name: {name}")
         return cls(cls._NAME_TO_VALUE[name], spelling=name)
@@ -48,15 +62,15 @@ class PitchClass:
     @classmethod
     def from_value(cls, value: int) -> PitchClass:
         """Create PitchClass from integer value (0-11)"""
-        return cls(value % 12)
+        return _PC_CACHE[value % 12]
 
     def interval_to(self, other: PitchClass) -> int:
         """Calculate ascending interval in semitones to another pitch class"""
-        return (other.value - self.value) % 12
+        return (other._value - self._value) % 12
 
     def transpose(self, semitones: int) -> PitchClass:
-        """Return new PitchClass transposed by given semitones"""
-        return PitchClass((self._value + semitones) % 12)
+        """Return PitchClass transposed by given semitones"""
+        return _PC_CACHE[(self._value + semitones) % 12]
 
     def name(self, prefer_flat: bool = False) -> str:
         """Get note name, optionally preferring flat spelling"""
@@ -84,6 +98,30 @@ class PitchClass:
         return self.name()
 
 
+def _pc_transpose(value: int, semitones: int) -> int:
+    """Transpose a raw pitch class integer"""
+    return (value + semitones) % 12
+
+
+def _pc_interval(a: int, b: int) -> int:
+    """Ascending interval in semitones between two raw pitch class integers"""
+    return (b - a) % 12
+
+
+# Perfect-hash table for note names: index = (letter - 'A') << 2 | accidental,
+# accidental 0 = natural, 1 = '#', 2 = 'b'; -1 marks an unknown name
+_NAME_TABLE = [-1] * 32
+for _name, _value in PitchClass._NAME_TO_VALUE.items():
+    _mod = ('', '#', 'b').index(_name[1:])
+    _NAME_TABLE[((ord(_name[0]) - 65) << 2) | _mod] = _value
+_NAME_TABLE = tuple(_NAME_TABLE)
+del _name, _value, _mod
+
+
+# Shared unspelled instances, PitchClass is immutable so these can be reused
+_PC_CACHE = tuple(PitchClass(i) for i in range(12))
+
+
 # Common pitch class constants
 C = PitchClass(0)
 Db = PitchClass(1, 'Db')
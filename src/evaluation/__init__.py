@@ -5,5 +5,6 @@ from .musdr import (
     chord_progression_irregularity,
     structureness_indicator,
     evaluate_progression,
+    evaluate_batch,
     EvaluationResult
 )
@@ -8,14 +8,20 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
 from collections import Counter
+import functools
 import math
 
 from ..core.chord import ChordSymbol, ChordQuality
 from ..core.pitch import PitchClass
-from ..voiceleading.guidetone import average_voice_leading_cost
+from ..voiceleading.guidetone import voice_leading_stats
 
 
-@dataclass
+# Reciprocals for the clamped terms of overall_score
+_INV3 = 1.0 / 3.0
+_INV4 = 1.0 / 4.0
+
+
+@dataclass(frozen=True, slots=True)
 class EvaluationResult:
     """Complete evaluation results for a chord progression"""
     # Pitch-based metrics
@@ -40,128 +46,150 @@ class EvaluationResult:
 
     def overall_score(self) -> float:
         """Compute weighted overall quality score"""
+        h = self.pitch_class_entropy
+        vl = self.voice_leading_cost
         return (
             0.2 * self.variety_score +
             0.3 * self.coherence_score +
-            0.2 * min(1.0, self.pitch_class_entropy / 3.0) +
-            0.15 * (1.0 - min(1.0, self.voice_leading_cost / 4.0)) +
+            0.2 * (h * _INV3 if h < 3.0 else 1.0) +
+            0.15 * (1.0 - (vl * _INV4 if vl < 4.0 else 1.0)) +
             0.15 * self.smooth_ratio
         )
 
+    @staticmethod
+    def overall_score_batch(results: List[EvaluationResult]) -> List[float]:
+        """Compute overall scores for many results"""
+        return [r.overall_score() for r in results]
+
+
+# Shared result for empty progressions
+_EMPTY_RESULT = EvaluationResult(
+    pitch_class_entropy=0.0,
+    root_entropy=0.0,
+    chord_progression_irregularity=0.0,
+    bigram_entropy=0.0,
+    structureness_indicator=0.0,
+    functional_coherence=0.0,
+    voice_leading_cost=0.0,
+    smooth_ratio=0.0,
+    variety_score=0.0,
+    coherence_score=0.0,
+)
+
+
+# Common interval patterns in jazz (and their "regularity" weights)
+_COMMON_INTERVALS = {
+    5: 1.0,   # Perfect 4th up (ii-V, V-I)
+    7: 0.9,   # Perfect 5th up (I-V, IV-I)
+    2: 0.8,   # Whole step (chromatic approach)
+    10: 0.7,  # Minor 3rd down (relative minor)
+    3: 0.6,   # Minor 3rd up
+    4: 0.5,   # Major 3rd (Coltrane)
+}
+
+# Per-interval irregularity (1 - regularity), indexed by interval 0-11
+_CPI_IRREGULARITY = tuple(
+    1.0 - _COMMON_INTERVALS.get(interval, 0.3) for interval in range(12)
+)
+
+
+_MIN7_ORD = ChordQuality.MIN7._ord
+_DOM7_ORD = ChordQuality.DOM7._ord
+
+
+def _encode_progression(
+    chords: List[ChordSymbol]
+) -> Tuple[List[int], List[int], List[int]]:
+    """Materialize integer roots, quality ordinals and root intervals once.
+
+    The metric kernels below operate on these lists so an evaluation walks
+    the ChordSymbol objects a single time.
+    """
+    roots = [chord.root._value for chord in chords]
+    quals = [chord.quality._ord for chord in chords]
+    intervals = [(b - a) % 12 for a, b in zip(roots, roots[1:])]
+    return roots, quals, intervals
 
-def pitch_class_entropy(chords: List[ChordSymbol]) -> float:
-    """Calculate pitch class entropy (H) for chord roots.
 
-    Higher entropy = more variety in root notes.
-    Max entropy for 12 pitch classes = log2(12) ≈ 3.58
-    """
-    if not chords:
-        return 0.0
+_N_QUALITIES = len(ChordQuality)
 
-    root_counts = Counter(chord.root.value for chord in chords)
-    total = len(chords)
 
-    entropy = 0.0
-    for count in root_counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+# c * log2(c) for small counts; entropy kernels sum table entries instead of
+# calling log2 per bin
+_CLOG2C_SIZE = 1024
+_CLOG2C = tuple(c * math.log2(c) if c else 0.0 for c in range(_CLOG2C_SIZE))
 
-    return entropy
 
+def _clog2c(c: int) -> float:
+    return _CLOG2C[c] if c < _CLOG2C_SIZE else c * math.log2(c)
 
-def root_movement_entropy(chords: List[ChordSymbol]) -> float:
-    """Calculate entropy of root movements (intervals between consecutive roots)"""
-    if len(chords) < 2:
-        return 0.0
 
-    movements = []
-    for i in range(len(chords) - 1):
-        interval = chords[i].root.interval_to(chords[i + 1].root)
-        movements.append(interval)
+def _entropy_from_ids(ids: List[int], nbins: Optional[int] = None) -> float:
+    """Shannon entropy (bits) of a sequence of small integer ids.
 
-    movement_counts = Counter(movements)
-    total = len(movements)
+    With nbins, ids are histogrammed into a fixed list (bincount-style);
+    sparse id spaces such as packed bigrams are counted in a dict instead.
+    Uses H = (N log N - sum(c log c)) / N so each bin is one table lookup.
+    """
+    total = len(ids)
+    if total == 0:
+        return 0.0
 
-    entropy = 0.0
-    for count in movement_counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+    if nbins is not None:
+        counts = [0] * nbins
+        for i in ids:
+            counts[i] += 1
+    else:
+        counts = Counter(ids).values()
 
-    return entropy
+    if total < _CLOG2C_SIZE:
+        table = _CLOG2C
+        acc = 0.0
+        for count in counts:
+            acc += table[count]
+    else:
+        acc = sum(_clog2c(count) for count in counts)
 
+    return (_clog2c(total) - acc) / total
 
-def chord_bigram_entropy(chords: List[ChordSymbol]) -> float:
-    """Calculate entropy of chord bigrams (consecutive pairs)"""
-    if len(chords) < 2:
-        return 0.0
 
-    # Create bigram representation
-    bigrams = []
-    for i in range(len(chords) - 1):
-        # Use interval and quality pair as bigram
-        interval = chords[i].root.interval_to(chords[i + 1].root)
-        q1 = chords[i].quality.value
-        q2 = chords[i + 1].quality.value
-        bigrams.append((interval, q1, q2))
+def _pitch_class_entropy(roots: List[int]) -> float:
+    return _entropy_from_ids(roots, 12)
 
-    bigram_counts = Counter(bigrams)
-    total = len(bigrams)
 
-    entropy = 0.0
-    for count in bigram_counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+def _root_movement_entropy(intervals: List[int]) -> float:
+    return _entropy_from_ids(intervals, 12)
 
-    return entropy
 
+def _chord_bigram_entropy(quals: List[int], intervals: List[int]) -> float:
+    # Use interval and quality pair as bigram, packed into one int
+    bigrams = [
+        (q1 * _N_QUALITIES + q2) * 12 + interval
+        for interval, q1, q2 in zip(intervals, quals, quals[1:])
+    ]
+    return _entropy_from_ids(bigrams)
 
-def chord_progression_irregularity(chords: List[ChordSymbol]) -> float:
-    """Calculate Chord Progression Irregularity (CPI).
 
-    Measures how unpredictable/irregular the progression is.
-    Based on deviation from common jazz patterns.
-    """
-    if len(chords) < 2:
+def _chord_progression_irregularity(intervals: List[int]) -> float:
+    if not intervals:
         return 0.0
 
-    # Common interval patterns in jazz (and their "regularity" weights)
-    common_intervals = {
-        5: 1.0,   # Perfect 4th up (ii-V, V-I)
-        7: 0.9,   # Perfect 5th up (I-V, IV-I)
-        2: 0.8,   # Whole step (chromatic approach)
-        10: 0.7,  # Minor 3rd down (relative minor)
-        3: 0.6,   # Minor 3rd up
-        4: 0.5,   # Major 3rd (Coltrane)
-    }
+    return sum(map(_CPI_IRREGULARITY.__getitem__, intervals)) / len(intervals)
 
-    irregularity_sum = 0.0
-    for i in range(len(chords) - 1):
-        interval = chords[i].root.interval_to(chords[i + 1].root)
-        regularity = common_intervals.get(interval, 0.3)
-        irregularity_sum += (1.0 - regularity)
-
-    return irregularity_sum / (len(chords) - 1)
 
+def _structureness_indicator(roots: List[int], quals: List[int]) -> float:
+    n = len(roots)
+    if n < 4:
+        return 0.0
 
-def structureness_indicator(chords: List[ChordSymbol]) -> float:
-    """Calculate Structureness Indicator (SI).
+    # Pack each chord into one byte-sized code (root < 12, quality < 16)
+    codes = [r << 4 | q for r, q in zip(roots, quals)]
 
-    Measures the presence of repeated patterns and structure.
-    Higher = more structured/repetitive.
-    """
-    if len(chords) < 4:
+    # All chords distinct: no window of any length can repeat
+    if len(set(codes)) == n:
         return 0.0
 
-    # Convert to pattern representation
-    patterns = []
-    for chord in chords:
-        patterns.append((chord.root.value, chord.quality.value))
-
     # Look for repeated subsequences
-    n = len(patterns)
     repetition_score = 0.0
 
     # Check for 2-chord patterns
@@ -169,10 +197,18 @@ def structureness_indicator(chords: List[ChordSymbol]) -> float:
         if n < length * 2:
             continue
 
+        # Rolling window code: chord k of the window sits in byte k, so
+        # windows of up to 8 chords map to distinct ints without collisions
+        top = 8 * (length - 1)
+        window = 0
+        for k in range(length):
+            window |= codes[k] << (8 * k)
+
         pattern_counts = Counter()
-        for i in range(n - length + 1):
-            subseq = tuple(patterns[i:i + length])
-            pattern_counts[subseq] += 1
+        pattern_counts[window] += 1
+        for i in range(length, n):
+            window = (window >> 8) | (codes[i] << top)
+            pattern_counts[window] += 1
 
         # Score based on repetitions
         for count in pattern_counts.values():
@@ -182,52 +218,120 @@ def structureness_indicator(chords: List[ChordSymbol]) -> float:
     return min(1.0, repetition_score)
 
 
-def functional_coherence(chords: List[ChordSymbol], key: PitchClass) -> float:
-    """Measure how well the progression follows functional harmony.
-
-    Checks for proper dominant resolution, ii-V patterns, etc.
-    """
-    if len(chords) < 2:
+def _is_coherent_move(
+    q1: int,
+    q2: int,
+    interval: int,
+    from_key: bool,
+    to_key: bool
+) -> bool:
+    """Functional-harmony predicate for a single transition"""
+    # V -> I (dominant resolution)
+    if q1 == _DOM7_ORD and interval == 5:
+        return True
+
+    # ii -> V
+    if q1 == _MIN7_ORD and q2 == _DOM7_ORD and interval == 5:
+        return True
+
+    # IV -> I (plagal)
+    if interval == 7 and to_key:
+        return True
+
+    # I -> vi (common)
+    if from_key and interval == 9:
+        return True
+
+    # vi -> ii
+    if q1 == _MIN7_ORD and q2 == _MIN7_ORD and interval == 5:
+        return True
+
+    # Tritone sub resolution
+    if q1 == _DOM7_ORD and interval == 1:
+        return True
+
+    return False
+
+
+# Flat (q1, q2, interval, from_key, to_key) lookup table of the predicate
+_COHERENT_LUT: Tuple[int, ...] = tuple(
+    int(_is_coherent_move(q1, q2, interval, bool(from_key), bool(to_key)))
+    for q1 in range(_N_QUALITIES)
+    for q2 in range(_N_QUALITIES)
+    for interval in range(12)
+    for from_key in (0, 1)
+    for to_key in (0, 1)
+)
+
+
+def _functional_coherence(
+    roots: List[int],
+    quals: List[int],
+    intervals: List[int],
+    key: int
+) -> float:
+    total_moves = len(intervals)
+    if total_moves < 1:
         return 1.0
 
+    lut = _COHERENT_LUT
+    at_key = [r == key for r in roots]
     coherent_moves = 0
-    total_moves = len(chords) - 1
-
     for i in range(total_moves):
-        c1, c2 = chords[i], chords[i + 1]
-        interval = c1.root.interval_to(c2.root)
+        index = (quals[i] * _N_QUALITIES + quals[i + 1]) * 12 + intervals[i]
+        coherent_moves += lut[((index << 1) | at_key[i]) << 1 | at_key[i + 1]]
+
+    return coherent_moves / total_moves
+
+
+def pitch_class_entropy(chords: List[ChordSymbol]) -> float:
+    """Calculate pitch class entropy (H) for chord roots.
+
+    Higher entropy = more variety in root notes.
+    Max entropy for 12 pitch classes = log2(12) ≈ 3.58
+    """
+    return _pitch_class_entropy([chord.root._value for chord in chords])
 
-        # Check for functional progressions
-        is_coherent = False
 
-        # V -> I (dominant resolution)
-        if c1.quality == ChordQuality.DOM7 and interval == 5:
-            is_coherent = True
+def root_movement_entropy(chords: List[ChordSymbol]) -> float:
+    """Calculate entropy of root movements (intervals between consecutive roots)"""
+    _, _, intervals = _encode_progression(chords)
+    return _root_movement_entropy(intervals)
 
-        # ii -> V
-        if c1.quality == ChordQuality.MIN7 and c2.quality == ChordQuality.DOM7 and interval == 5:
-            is_coherent = True
 
-        # IV -> I (plagal)
-        if interval == 7 and c2.root == key:
-            is_coherent = True
+def chord_bigram_entropy(chords: List[ChordSymbol]) -> float:
+    """Calculate entropy of chord bigrams (consecutive pairs)"""
+    _, quals, intervals = _encode_progression(chords)
+    return _chord_bigram_entropy(quals, intervals)
 
-        # I -> vi (common)
-        if c1.root == key and interval == 9:
-            is_coherent = True
 
-        # vi -> ii
-        if c1.quality == ChordQuality.MIN7 and c2.quality == ChordQuality.MIN7 and interval == 5:
-            is_coherent = True
+def chord_progression_irregularity(chords: List[ChordSymbol]) -> float:
+    """Calculate Chord Progression Irregularity (CPI).
 
-        # Tritone sub resolution
-        if c1.quality == ChordQuality.DOM7 and interval == 1:
-            is_coherent = True
+    Measures how unpredictable/irregular the progression is.
+    Based on deviation from common jazz patterns.
+    """
+    _, _, intervals = _encode_progression(chords)
+    return _chord_progression_irregularity(intervals)
 
-        if is_coherent:
-            coherent_moves += 1
 
-    return coherent_moves / total_moves if total_moves > 0 else 1.0
+def structureness_indicator(chords: List[ChordSymbol]) -> float:
+    """Calculate Structureness Indicator (SI).
+
+    Measures the presence of repeated patterns and structure.
+    Higher = more structured/repetitive.
+    """
+    roots, quals, _ = _encode_progression(chords)
+    return _structureness_indicator(roots, quals)
+
+
+def functional_coherence(chords: List[ChordSymbol], key: PitchClass) -> float:
+    """Measure how well the progression follows functional harmony.
+
+    Checks for proper dominant resolution, ii-V patterns, etc.
+    """
+    roots, quals, intervals = _encode_progression(chords)
+    return _functional_coherence(roots, quals, intervals, key._value)
 
 
 def quality_variety(chords: List[ChordSymbol]) -> float:
@@ -254,41 +358,29 @@ def evaluate_progression(
         EvaluationResult with all metrics
     """
     if not chords:
-        return EvaluationResult(
-            pitch_class_entropy=0.0,
-            root_entropy=0.0,
-            chord_progression_irregularity=0.0,
-            bigram_entropy=0.0,
-            structureness_indicator=0.0,
-            functional_coherence=0.0,
-            voice_leading_cost=0.0,
-            smooth_ratio=0.0,
-            variety_score=0.0,
-            coherence_score=0.0,
-        )
+        return _EMPTY_RESULT
 
     if key is None:
         key = chords[0].root
 
-    # Calculate metrics
-    h = pitch_class_entropy(chords)
-    root_h = root_movement_entropy(chords)
-    cpi = chord_progression_irregularity(chords)
-    bigram_h = chord_bigram_entropy(chords)
-    si = structureness_indicator(chords)
-    fc = functional_coherence(chords, key)
-    vl_cost = average_voice_leading_cost(chords)
-
-    # Calculate smooth ratio
-    smooth_count = 0
-    if len(chords) >= 2:
-        from ..voiceleading.guidetone import voice_leading_cost
-        for i in range(len(chords) - 1):
-            if voice_leading_cost(chords[i], chords[i + 1]) <= 2:
-                smooth_count += 1
-        smooth_ratio = smooth_count / (len(chords) - 1)
-    else:
-        smooth_ratio = 1.0
+    return _evaluate_cached(tuple(chords), key._value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _evaluate_cached(
+    chords: Tuple[ChordSymbol, ...],
+    key_value: int
+) -> EvaluationResult:
+    """Evaluate a non-empty progression; results are shared between callers"""
+    # Calculate metrics over integer encodings built once
+    roots, quals, intervals = _encode_progression(chords)
+    h = _pitch_class_entropy(roots)
+    root_h = _root_movement_entropy(intervals)
+    cpi = _chord_progression_irregularity(intervals)
+    bigram_h = _chord_bigram_entropy(quals, intervals)
+    si = _structureness_indicator(roots, quals)
+    fc = _functional_coherence(roots, quals, intervals, key_value)
+    vl_cost, smooth_ratio = voice_leading_stats(chords)
 
     # Compute aggregate scores
     variety = (
@@ -317,6 +409,89 @@ def evaluate_progression(
     )
 
 
+def evaluate_batch(
+    progressions: List[List[ChordSymbol]],
+    key: Optional[PitchClass] = None
+) -> List[EvaluationResult]:
+    """Evaluate many progressions in one call.
+
+    Progressions repeated within the batch (or seen in earlier calls) are
+    evaluated once and share their result.
+
+    Args:
+        progressions: Progressions to evaluate
+        key: Optional key context (defaults to each progression's first root)
+
+    Returns:
+        One EvaluationResult per progression, in input order
+    """
+    evaluate = _evaluate_cached
+    key_value = key._value if key is not None else None
+
+    results = []
+    for chords in progressions:
+        if not chords:
+            results.append(_EMPTY_RESULT)
+        elif key_value is None:
+            results.append(evaluate(tuple(chords), chords[0].root._value))
+        else:
+            results.append(evaluate(tuple(chords), key_value))
+    return results
+
+
+def clear_evaluation_cache():
+    """Clear the memoized evaluate_progression results"""
+    _evaluate_cached.cache_clear()
+
+
+# Metric order used by compare_progressions_array
+METRIC_NAMES: Tuple[str, ...] = (
+    'pitch_class_entropy',
+    'root_entropy',
+    'cpi',
+    'bigram_entropy',
+    'structureness',
+    'functional_coherence',
+    'voice_leading_cost',
+    'smooth_ratio',
+    'variety',
+    'coherence',
+    'overall',
+)
+
+
+def _metric_vector(result: EvaluationResult) -> Tuple[float, ...]:
+    """Metric values of a result in METRIC_NAMES order"""
+    return (
+        result.pitch_class_entropy,
+        result.root_entropy,
+        result.chord_progression_irregularity,
+        result.bigram_entropy,
+        result.structureness_indicator,
+        result.functional_coherence,
+        result.voice_leading_cost,
+        result.smooth_ratio,
+        result.variety_score,
+        result.coherence_score,
+        result.overall_score(),
+    )
+
+
+def compare_progressions_array(
+    prog1: List[ChordSymbol],
+    prog2: List[ChordSymbol],
+    key: Optional[PitchClass] = None
+) -> List[Tuple[float, float]]:
+    """Compare two progressions as rows of (prog1_value, prog2_value).
+
+    Rows follow METRIC_NAMES, so results from many comparisons can be
+    stacked and reduced per metric.
+    """
+    eval1 = evaluate_progression(prog1, key)
+    eval2 = evaluate_progression(prog2, key)
+    return list(zip(_metric_vector(eval1), _metric_vector(eval2)))
+
+
 def compare_progressions(
     prog1: List[ChordSymbol],
     prog2: List[ChordSymbol],
@@ -326,22 +501,7 @@ def compare_progressions(
 
     Returns dict mapping metric name to (prog1_value, prog2_value).
     """
-    eval1 = evaluate_progression(prog1, key)
-    eval2 = evaluate_progression(prog2, key)
-
-    return {
-        'pitch_class_entropy': (eval1.pitch_class_entropy, eval2.pitch_class_entropy),
-        'root_entropy': (eval1.root_entropy, eval2.root_entropy),
-        'cpi': (eval1.chord_progression_irregularity, eval2.chord_progression_irregularity),
-        'bigram_entropy': (eval1.bigram_entropy, eval2.bigram_entropy),
-        'structureness': (eval1.structureness_indicator, eval2.structureness_indicator),
-        'functional_coherence': (eval1.functional_coherence, eval2.functional_coherence),
-        'voice_leading_cost': (eval1.voice_leading_cost, eval2.voice_leading_cost),
-        'smooth_ratio': (eval1.smooth_ratio, eval2.smooth_ratio),
-        'variety': (eval1.variety_score, eval2.variety_score),
-        'coherence': (eval1.coherence_score, eval2.coherence_score),
-        'overall': (eval1.overall_score(), eval2.overall_score()),
-    }
+    return dict(zip(METRIC_NAMES, compare_progressions_array(prog1, prog2, key)))
 
 
 def print_evaluation(result: EvaluationResult, name: str = "Progression"):
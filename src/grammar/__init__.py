@@ -1,4 +1,4 @@
 """PCFG Grammar Engine for Jazz Harmony"""
 
-from .rules import GrammarRule, RuleType, NonTerminal, Symbol, PCFG, create_base_grammar
+from .rules import GrammarRule, RuleType, RuleTag, NonTerminal, Symbol, PCFG, create_base_grammar
 from .generator import HarmonyGenerator, GeneratorConfig, generate_progression
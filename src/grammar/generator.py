@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from bisect import bisect_left
 from typing import List, Optional, Tuple, Dict, Any
 import random
 
 from .rules import (
     PCFG, GrammarRule, NonTerminal, Symbol, NTSymbol, TerminalSymbol,
-    RuleType, create_base_grammar, DEGREE_TO_SEMITONES
+    RuleType, create_base_grammar, DEGREE_TO_SEMITONES, _nt_symbol
 )
 from ..core.pitch import PitchClass
 from ..core.chord import ChordSymbol, ChordQuality
 
 
 # Map degree strings to ChordQuality
-QUALITY_MAP = {
+QUALITY_MAP = MappingProxyType({
     'maj7': ChordQuality.MAJ7,
     'min7': ChordQuality.MIN7,
     '7': ChordQuality.DOM7,
@@ -22,10 +24,26 @@ QUALITY_MAP = {
     'dim7': ChordQuality.DIM7,
     'maj6': ChordQuality.MAJ6,
     'min6': ChordQuality.MIN6,
+})
+_QUALITY_DEFAULT = ChordQuality.MAJ7
+
+# Pitch classes indexed by value, for terminal -> chord conversion
+_PC_TABLE = tuple(PitchClass.from_value(i) for i in range(12))
+
+# Fallback terminal per non-terminal when no rule can be applied
+_DEFAULT_I_MAJ7 = TerminalSymbol("I", "maj7")
+_DEFAULT_TERMINALS: Dict[NonTerminal, TerminalSymbol] = {
+    NonTerminal.T: _DEFAULT_I_MAJ7,
+    NonTerminal.D: TerminalSymbol("V", "7"),
+    NonTerminal.SD: TerminalSymbol("IV", "maj7"),
+    NonTerminal.PREP: TerminalSymbol("ii", "min7"),
+    NonTerminal.PROL: TerminalSymbol("vi", "min7"),
+    NonTerminal.S: _DEFAULT_I_MAJ7,
+    NonTerminal.PHRASE: _DEFAULT_I_MAJ7,
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class DerivationNode:
     """Node in derivation tree"""
     symbol: Symbol
@@ -38,17 +56,28 @@ class DerivationNode:
 
     def get_terminals(self) -> List[Tuple[TerminalSymbol, int]]:
         """Get all terminal symbols with their key contexts"""
-        if self.is_terminal():
-            return [(self.symbol, self.key)]
         result = []
-        for child in self.children:
-            result.extend(child.get_terminals())
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node.symbol, TerminalSymbol):
+                result.append((node.symbol, node.key))
+            else:
+                stack.extend(reversed(node.children))
         return result
 
     def depth(self) -> int:
-        if not self.children:
-            return 0
-        return 1 + max(c.depth() for c in self.children)
+        max_depth = 0
+        stack = [(self, 0)]
+        while stack:
+            node, d = stack.pop()
+            if node.children:
+                d += 1
+                for child in node.children:
+                    stack.append((child, d))
+            elif d > max_depth:
+                max_depth = d
+        return max_depth
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -67,7 +96,7 @@ class DerivationNode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratorConfig:
     """Configuration for the generator"""
     max_depth: int = 6
@@ -80,12 +109,36 @@ class GeneratorConfig:
 class HarmonyGenerator:
     """Top-down derivation generator for jazz progressions"""
 
-    def __init__(self, grammar: Optional[PCFG] = None, config: Optional[GeneratorConfig] = None):
+    def __init__(
+        self,
+        grammar: Optional[PCFG] = None,
+        config: Optional[GeneratorConfig] = None,
+        rng: Optional[random.Random] = None
+    ):
         self.grammar = grammar or create_base_grammar()
         self.config = config or GeneratorConfig()
 
-        if self.config.seed is not None:
-            random.seed(self.config.seed)
+        # Per non-terminal lookups used when derivation hits the depth limit
+        self._terminal_rules_by_nt: Dict[NonTerminal, List[GrammarRule]] = {
+            nt: [r for r in self.grammar.get_rules(nt)
+                 if r.rule_type == RuleType.TERMINAL]
+            for nt in NonTerminal
+        }
+        self._default_terminal_by_nt: Dict[NonTerminal, TerminalSymbol] = {
+            nt: self._get_default_terminal(nt) for nt in NonTerminal
+        }
+
+        # (rules, cumulative weights, total weight) per non-terminal, taken
+        # from the grammar's own sampling cache
+        self._sample_table: Dict[NonTerminal, Tuple[Tuple[GrammarRule, ...], Tuple[float, ...], float]] = {}
+        for nt in NonTerminal:
+            rules, cum = self.grammar._sampling_entry(nt)
+            if rules:
+                self._sample_table[nt] = (rules, cum, cum[-1])
+
+        # Generator-local RNG so sampling doesn't touch global random state;
+        # a caller can pass its own to keep drawing from it afterwards
+        self._rand = rng if rng is not None else random.Random(self.config.seed)
 
     def generate(self) -> List[ChordSymbol]:
         """Generate a chord progression"""
@@ -107,77 +160,87 @@ class HarmonyGenerator:
         return chords, tree
 
     def _derive(self, symbol: Symbol, depth: int) -> DerivationNode:
-        """Recursively derive from a symbol"""
-        if isinstance(symbol, TerminalSymbol):
-            key = self.config.key
-            return DerivationNode(symbol=symbol, key=key)
+        """Derive a tree from a symbol, expanding nodes from an explicit stack"""
+        sample_table = self._sample_table
+        rand = self._rand
+        terminal_rules_by_nt = self._terminal_rules_by_nt
+        default_terminal_by_nt = self._default_terminal_by_nt
+        max_depth = self.config.max_depth
+
+        key = self.config.key
+        if isinstance(symbol, NTSymbol) and symbol.key is not None:
+            key = symbol.key
+
+        # Each entry is (parent's children list, symbol, depth, key context);
+        # children are pushed in reverse so they expand left to right
+        root: List[DerivationNode] = []
+        stack = [(root, symbol, depth, key)]
+
+        while stack:
+            siblings, symbol, depth, key = stack.pop()
+
+            if isinstance(symbol, TerminalSymbol):
+                siblings.append(DerivationNode(symbol=symbol, key=key))
+                continue
+
+            if not isinstance(symbol, NTSymbol):
+                raise ValueError(f"Unknown symbol type: {type(symbol)}")
 
-        if isinstance(symbol, NTSymbol):
             nt = symbol.nt
-            key = symbol.key if symbol.key is not None else self.config.key
 
             # Check depth limit
-            if depth >= self.config.max_depth:
+            if depth >= max_depth:
                 # Force terminal
-                terminal_rules = [r for r in self.grammar.get_rules(nt)
-                                  if r.rule_type == RuleType.TERMINAL]
-                if terminal_rules:
-                    rule = random.choice(terminal_rules)
+                terminal_rules = terminal_rules_by_nt[nt]
+                rule = rand.choice(terminal_rules) if terminal_rules else None
+            elif nt in sample_table:
+                rules, cum, total = sample_table[nt]
+                if total == 0:
+                    rule = rand.choice(rules)
                 else:
-                    # Fallback: create default terminal
-                    default_terminal = self._get_default_terminal(nt)
-                    return DerivationNode(symbol=default_terminal, key=key)
+                    idx = bisect_left(cum, rand.random() * total)
+                    rule = rules[idx] if idx < len(rules) else rules[-1]
             else:
-                rule = self.grammar.sample_rule(nt)
+                rule = None
 
             if rule is None:
                 # No rules available, use default terminal
-                default_terminal = self._get_default_terminal(nt)
-                return DerivationNode(symbol=default_terminal, key=key)
+                default_terminal = default_terminal_by_nt[nt]
+                siblings.append(DerivationNode(symbol=default_terminal, key=key))
+                continue
+
+            children: List[DerivationNode] = []
+            siblings.append(DerivationNode(
+                symbol=symbol,
+                children=children,
+                rule_used=rule,
+                key=key
+            ))
 
             # Apply rule
-            children = []
+            pending = []
             for rhs_sym in rule.rhs:
                 child_key = key
                 if isinstance(rhs_sym, NTSymbol) and rhs_sym.key is not None:
                     child_key = rhs_sym.key
 
-                # Handle key modulation for secondary dominants
-                if isinstance(rhs_sym, TerminalSymbol) and 'V/' in rhs_sym.degree:
-                    # Secondary dominant: adjust key
-                    target = rhs_sym.degree.split('/')[1]
-                    if target in DEGREE_TO_SEMITONES:
-                        child_key = (key + DEGREE_TO_SEMITONES[target]) % 12
+                # Secondary dominant: adjust key
+                if isinstance(rhs_sym, TerminalSymbol) and rhs_sym.secondary_target is not None:
+                    child_key = (key + DEGREE_TO_SEMITONES[rhs_sym.secondary_target]) % 12
 
                 child_sym = rhs_sym
                 if isinstance(child_sym, NTSymbol):
-                    child_sym = NTSymbol(child_sym.nt, child_key)
+                    child_sym = _nt_symbol(child_sym.nt, child_key)
 
-                child_node = self._derive(child_sym, depth + 1)
-                child_node.key = child_key
-                children.append(child_node)
+                pending.append((children, child_sym, depth + 1, child_key))
 
-            return DerivationNode(
-                symbol=symbol,
-                children=children,
-                rule_used=rule,
-                key=key
-            )
+            stack.extend(reversed(pending))
 
-        raise ValueError(f"Unknown symbol type: {type(symbol)}")
+        return root[0]
 
     def _get_default_terminal(self, nt: NonTerminal) -> TerminalSymbol:
         """Get default terminal for a non-terminal"""
-        defaults = {
-            NonTerminal.T: TerminalSymbol("I", "maj7"),
-            NonTerminal.D: TerminalSymbol("V", "7"),
-            NonTerminal.SD: TerminalSymbol("IV", "maj7"),
-            NonTerminal.PREP: TerminalSymbol("ii", "min7"),
-            NonTerminal.PROL: TerminalSymbol("vi", "min7"),
-            NonTerminal.S: TerminalSymbol("I", "maj7"),
-            NonTerminal.PHRASE: TerminalSymbol("I", "maj7"),
-        }
-        return defaults.get(nt, TerminalSymbol("I", "maj7"))
+        return _DEFAULT_TERMINALS.get(nt, _DEFAULT_I_MAJ7)
 
     def _terminals_to_chords(self, terminals: List[Tuple[TerminalSymbol, int]]) -> List[ChordSymbol]:
         """Convert terminal symbols to ChordSymbol objects"""
@@ -195,15 +258,14 @@ class HarmonyGenerator:
         if '/' in degree:
             degree = 'V'  # Simplify to V for now
 
-        # Get interval from degree
-        interval = DEGREE_TO_SEMITONES.get(degree, 0)
-
-        # Calculate root
-        root_pc = (key + interval) % 12
-        root = PitchClass.from_value(root_pc)
+        # Calculate root from the degree's interval above the key
+        root = _PC_TABLE[(key + DEGREE_TO_SEMITONES.get(degree, 0)) % 12]
 
         # Get quality
-        quality = QUALITY_MAP.get(terminal.quality, ChordQuality.MAJ7)
+        try:
+            quality = QUALITY_MAP[terminal.quality]
+        except KeyError:
+            quality = _QUALITY_DEFAULT
 
         return ChordSymbol(root=root, quality=quality)
 
@@ -214,7 +276,7 @@ class HarmonyGenerator:
     def set_seed(self, seed: int):
         """Set random seed for reproducibility"""
         self.config.seed = seed
-        random.seed(seed)
+        self._rand.seed(seed)
 
 
 def generate_progression(
@@ -1,49 +1,116 @@
 """Jazz Harmony Treebank Parser - Extract rule statistics from JHT"""
 
 from __future__ import annotations
+import functools
+import heapq
 import json
+import os
+import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter, itemgetter, methodcaller
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import re
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json parses bytes too
+    _json_loads = json.loads
+
+
+# Root note, and root note followed by the quality suffix
+_ROOT_RE = re.compile(r'^([A-G][#b]?)', re.ASCII)
+_CHORD_RE = re.compile(r'^[A-G][#b]?(.*)$', re.ASCII)
+
 
-@dataclass
 class TreeNode:
     """Node in a harmonic analysis tree"""
-    label: str
-    children: List[TreeNode]
-    is_implicit: bool = False  # Marked with * in JHT
+    __slots__ = ('label', 'children', 'is_implicit')
+
+    def __init__(self, label: str, children: List[TreeNode], is_implicit: bool = False):
+        self.label = label
+        self.children = children
+        self.is_implicit = is_implicit  # Marked with * in JHT
+
+    def __repr__(self) -> str:
+        return (f"TreeNode(label={self.label!r}, children={self.children!r}, "
+                f"is_implicit={self.is_implicit!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.label, self.children, self.is_implicit) == \
+            (other.label, other.children, other.is_implicit)
+
+    __hash__ = None
 
     @classmethod
     def from_dict(cls, d: Dict) -> TreeNode:
         """Create TreeNode from JHT JSON structure"""
-        label = d.get('label', '')
-        is_implicit = label.endswith('*')
-        if is_implicit:
-            label = label[:-1]
-
-        children = [cls.from_dict(c) for c in d.get('children', [])]
-        return cls(label=label, children=children, is_implicit=is_implicit)
+        # Nodes are created parent-first; each entry carries the children
+        # list of its parent, filled left to right as the stack unwinds
+        root: List[TreeNode] = []
+        stack = [(d, root)]
+        while stack:
+            d, siblings = stack.pop()
+            label = d['label'] if 'label' in d else ''
+            is_implicit = label.endswith('*')
+            if is_implicit:
+                label = label[:-1]
+
+            children: List[TreeNode] = []
+            siblings.append(cls(label, children, is_implicit))
+            child_dicts = d.get('children')
+            if child_dicts:
+                for c in reversed(child_dicts):
+                    stack.append((c, children))
+        return root[0]
 
     def is_leaf(self) -> bool:
         return len(self.children) == 0
 
     def depth(self) -> int:
-        if self.is_leaf():
-            return 0
-        return 1 + max(c.depth() for c in self.children)
+        max_depth = 0
+        stack = [(self, 0)]
+        while stack:
+            node, d = stack.pop()
+            if node.children:
+                d += 1
+                for c in node.children:
+                    stack.append((c, d))
+            elif d > max_depth:
+                max_depth = d
+        return max_depth
 
     def leaf_sequence(self) -> List[str]:
         """Get chord sequence from leaves"""
-        if self.is_leaf():
-            return [self.label]
         result = []
-        for c in self.children:
-            result.extend(c.leaf_sequence())
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(reversed(node.children))
+            else:
+                result.append(node.label)
         return result
 
+    def first_leaf(self) -> str:
+        """Label of the leftmost leaf, following only the left spine"""
+        node = self
+        while node.children:
+            node = node.children[0]
+        return node.label
+
+    def last_leaf(self) -> str:
+        """Label of the rightmost leaf, following only the right spine"""
+        node = self
+        while node.children:
+            node = node.children[-1]
+        return node.label
+
 
 @dataclass
 class RuleStats:
@@ -55,41 +122,76 @@ class RuleStats:
     cadences: Counter      # cadence pattern -> count
 
 
+# Normalized names for JHT quality suffixes
+_QUALITY_MAP = {
+    '': 'maj',
+    '^7': 'maj7',
+    '7': 'dom7',
+    'm7': 'min7',
+    'm': 'min',
+    'm7b5': 'hdim7',
+    '%7': 'hdim7',
+    '%': 'hdim7',
+    'o7': 'dim7',
+    'o': 'dim',
+    '+': 'aug',
+    'sus': 'sus4',
+    '6': 'maj6',
+    'm6': 'min6',
+}
+
+# Pitch class of every root spelling extract_root can return ([A-G][#b]?)
+_NATURAL_PC = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+_NOTE_PC: Dict[str, int] = {}
+for _name, _pc in _NATURAL_PC.items():
+    _NOTE_PC[_name] = _pc
+    _NOTE_PC[_name + '#'] = (_pc + 1) % 12
+    _NOTE_PC[_name + 'b'] = (_pc - 1) % 12
+del _name, _pc
+
+# (interval above key, normalized quality) -> harmonic function
+_FUNCTION_TABLE: Dict[Tuple[int, str], str] = {}
+for _interval, _qualities, _func in (
+    (0, ('maj', 'maj7', 'maj6'), 'T'),    # Tonic
+    (7, ('dom7', '7', 'sus4'), 'D'),      # Dominant
+    (2, ('min7', 'min'), 'SD'),           # Subdominant (ii)
+    (5, ('maj', 'maj7'), 'SD'),           # Subdominant (IV)
+    (9, ('min7', 'min'), 'T'),            # Tonic substitute (vi)
+    (4, ('min7', 'min'), 'T'),            # Tonic substitute (iii)
+    (11, ('hdim7', 'dim7'), 'D'),         # Dominant function (vii)
+):
+    for _quality in _qualities:
+        _FUNCTION_TABLE[(_interval, _quality)] = _func
+del _interval, _qualities, _func, _quality
+
+# Qualities classified as (secondary) dominants at any other interval
+_DOM_QUALITIES = frozenset(('dom7', '7'))
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_chord_type(chord: str) -> str:
-    """Extract chord type/quality from chord symbol"""
+    """Extract chord type/quality from chord symbol.
+
+    Results are interned so counter-key comparisons short-circuit on identity.
+    """
     # Remove root note
-    match = re.match(r'^[A-G][#b]?(.*)$', chord)
+    match = _CHORD_RE.match(chord)
     if not match:
-        return chord
-    quality = match.group(1)
+        return sys.intern(chord)
+    quality = match[1]
 
     # Normalize quality
-    quality_map = {
-        '': 'maj',
-        '^7': 'maj7',
-        '7': 'dom7',
-        'm7': 'min7',
-        'm': 'min',
-        'm7b5': 'hdim7',
-        '%7': 'hdim7',
-        '%': 'hdim7',
-        'o7': 'dim7',
-        'o': 'dim',
-        '+': 'aug',
-        'sus': 'sus4',
-        '6': 'maj6',
-        'm6': 'min6',
-    }
-
-    return quality_map.get(quality, quality)
+    return sys.intern(_QUALITY_MAP.get(quality, quality))
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_root(chord: str) -> Optional[str]:
     """Extract root note from chord symbol"""
-    match = re.match(r'^([A-G][#b]?)', chord)
-    return match.group(1) if match else None
+    match = _ROOT_RE.match(chord)
+    return match[1] if match else None
 
 
+@functools.lru_cache(maxsize=16384)
 def classify_function(chord: str, key: str) -> str:
     """Classify chord function relative to key"""
     root = extract_root(chord)
@@ -99,115 +201,146 @@ def classify_function(chord: str, key: str) -> str:
     if not root:
         return 'unknown'
 
-    # Simple pitch class mapping
-    pc_map = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
-
-    def to_pc(note: str) -> int:
-        base = pc_map.get(note[0], 0)
-        if len(note) > 1:
-            if note[1] == '#':
-                base += 1
-            elif note[1] == 'b':
-                base -= 1
-        return base % 12
-
-    root_pc = to_pc(root)
-    key_pc = to_pc(key_root)
-    interval = (root_pc - key_pc) % 12
+    interval = (_NOTE_PC[root] - _NOTE_PC[key_root]) % 12
 
     # Functional classification
-    if interval == 0 and quality in ('maj', 'maj7', 'maj6'):
-        return 'T'  # Tonic
-    elif interval == 7 and quality in ('dom7', '7', 'sus4'):
-        return 'D'  # Dominant
-    elif interval == 2 and quality in ('min7', 'min'):
-        return 'SD'  # Subdominant (ii)
-    elif interval == 5 and quality in ('maj', 'maj7'):
-        return 'SD'  # Subdominant (IV)
-    elif interval == 9 and quality in ('min7', 'min'):
-        return 'T'  # Tonic substitute (vi)
-    elif interval == 4 and quality in ('min7', 'min'):
-        return 'T'  # Tonic substitute (iii)
-    elif interval == 11 and quality in ('hdim7', 'dim7'):
-        return 'D'  # Dominant function (vii)
-    elif quality in ('dom7', '7'):
-        return 'D'  # Secondary dominant
-    else:
-        return 'other'
+    func = _FUNCTION_TABLE.get((interval, quality))
+    if func is not None:
+        return func
+    return 'D' if quality in _DOM_QUALITIES else 'other'
+
+
+def _edge_leaf_label(node: Any, children_of: Callable, label_of: Callable, index: int) -> str:
+    """Label of the leaf at the end of one spine (index 0 = left, -1 = right)"""
+    children = children_of(node)
+    while children:
+        node = children[index]
+        children = children_of(node)
+    return label_of(node)
+
+
+def _extract_rules(
+    root: Any,
+    key: str,
+    stats: RuleStats,
+    label_of: Callable[[Any], str],
+    children_of: Callable[[Any], Optional[List[Any]]]
+):
+    """Extract rules from a tree, visiting nodes in depth-first pre-order.
+
+    Works on any node type given accessors for a node's label and children.
+    """
+    # Collect keys per tree and merge them into the counters once at the end
+    term_keys = []
+    bin_keys = []
+    un_keys = []
+    prog_keys = []
+
+    # Entries carry the node's function once its parent has classified it,
+    # so every label is classified at most once per tree
+    stack = [(root, None)]
+    while stack:
+        node, parent_func = stack.pop()
+        children = children_of(node)
+
+        if not children:
+            # Terminal rule
+            term_keys.append(parse_chord_type(label_of(node)))
+
+        elif len(children) == 2:
+            # Binary rule
+            left = children[0]
+            right = children[1]
+
+            if parent_func is None:
+                parent_func = classify_function(label_of(node), key)
+            left_func = classify_function(label_of(left), key)
+            right_func = classify_function(label_of(right), key)
+
+            bin_keys.append((parent_func, left_func, right_func))
+
+            # Track progression across the boundary between the subtrees
+            last_left = parse_chord_type(_edge_leaf_label(left, children_of, label_of, -1))
+            first_right = parse_chord_type(_edge_leaf_label(right, children_of, label_of, 0))
+            prog_keys.append((last_left, first_right))
+
+            # Visit left subtree before right
+            stack.append((right, right_func))
+            stack.append((left, left_func))
+
+        elif len(children) == 1:
+            # Unary rule (substitution)
+            child = children[0]
+            if parent_func is None:
+                parent_func = classify_function(label_of(node), key)
+            child_func = classify_function(label_of(child), key)
+            un_keys.append((parent_func, child_func))
+            stack.append((child, child_func))
+
+    stats.terminal_rules.update(term_keys)
+    stats.binary_rules.update(bin_keys)
+    stats.unary_rules.update(un_keys)
+    stats.progressions.update(prog_keys)
+
+
+_node_label = attrgetter('label')
+_node_children = attrgetter('children')
 
 
 def extract_rules_from_tree(node: TreeNode, key: str, stats: RuleStats):
-    """Recursively extract rules from a tree"""
-    if node.is_leaf():
-        # Terminal rule
-        chord_type = parse_chord_type(node.label)
-        stats.terminal_rules[chord_type] += 1
-        return
-
-    if len(node.children) == 2:
-        # Binary rule
-        left = node.children[0]
-        right = node.children[1]
-
-        parent_func = classify_function(node.label, key)
-        left_func = classify_function(left.label, key)
-        right_func = classify_function(right.label, key)
-
-        stats.binary_rules[(parent_func, left_func, right_func)] += 1
-
-        # Track progressions between leaves
-        left_leaves = left.leaf_sequence()
-        right_leaves = right.leaf_sequence()
-        if left_leaves and right_leaves:
-            last_left = parse_chord_type(left_leaves[-1])
-            first_right = parse_chord_type(right_leaves[0])
-            stats.progressions[(last_left, first_right)] += 1
-
-        # Recurse
-        extract_rules_from_tree(left, key, stats)
-        extract_rules_from_tree(right, key, stats)
-
-    elif len(node.children) == 1:
-        # Unary rule (substitution)
-        child = node.children[0]
-        parent_func = classify_function(node.label, key)
-        child_func = classify_function(child.label, key)
-        stats.unary_rules[(parent_func, child_func)] += 1
-        extract_rules_from_tree(child, key, stats)
+    """Extract rules from a tree, visiting nodes in depth-first pre-order"""
+    _extract_rules(node, key, stats, _node_label, _node_children)
+
+
+@functools.lru_cache(maxsize=4096)
+def _strip_implicit(label: str) -> str:
+    return label[:-1] if label.endswith('*') else label
+
+
+def _dict_label(d: Dict) -> str:
+    """Label of a raw JHT node with the implicit marker (*) removed"""
+    return _strip_implicit(d.get('label', ''))
+
+
+_dict_children = methodcaller('get', 'children')
+
+
+def extract_rules_from_dict(d: Dict, key: str, stats: RuleStats):
+    """Extract rules straight from a raw JHT tree dict.
+
+    Same traversal and counts as extract_rules_from_tree, without first
+    building TreeNode objects for a tree that is read only once.
+    """
+    _extract_rules(d, key, stats, _dict_label, _dict_children)
 
 
 def detect_cadences(chords: List[str], key: str) -> List[str]:
     """Detect cadence patterns in chord sequence"""
+    # Classify each chord once; cadences are read off adjacent functions
+    funcs = [classify_function(chord, key) for chord in chords]
     cadences = []
-    n = len(chords)
-
-    for i in range(n - 1):
-        func1 = classify_function(chords[i], key)
-        func2 = classify_function(chords[i + 1] if i + 1 < n else '', key)
 
-        if func1 == 'D' and func2 == 'T':
-            # Check for ii-V-I
-            if i > 0 and classify_function(chords[i - 1], key) == 'SD':
-                cadences.append('ii-V-I')
-            else:
-                cadences.append('V-I')
-        elif func1 == 'SD' and func2 == 'T':
-            cadences.append('IV-I')
+    prev = None
+    for func1, func2 in zip(funcs, funcs[1:]):
+        if func2 == 'T':
+            if func1 == 'D':
+                # Check for ii-V-I
+                cadences.append('ii-V-I' if prev == 'SD' else 'V-I')
+            elif func1 == 'SD':
+                cadences.append('IV-I')
+        prev = func1
 
     return cadences
 
 
 def load_jht(path: str = 'treebank.json') -> List[Dict]:
-    """Load Jazz Harmony Treebank"""
-    with open(path, 'r') as f:
-        return json.load(f)
+    """Load Jazz Harmony Treebank (parsed with orjson when installed)"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
 
-def analyze_treebank(treebank_path: str) -> RuleStats:
-    """Analyze entire treebank and extract rule statistics"""
-    data = load_jht(treebank_path)
-
-    stats = RuleStats(
+def _new_stats() -> RuleStats:
+    return RuleStats(
         binary_rules=Counter(),
         unary_rules=Counter(),
         terminal_rules=Counter(),
@@ -215,8 +348,11 @@ def analyze_treebank(treebank_path: str) -> RuleStats:
         cadences=Counter()
     )
 
+
+def _analyze_items(items: List[Dict], stats: RuleStats) -> int:
+    """Accumulate rule statistics for treebank items, returns trees analyzed"""
     analyzed = 0
-    for item in data:
+    for item in items:
         if 'trees' not in item or not item['trees']:
             continue
 
@@ -226,13 +362,57 @@ def analyze_treebank(treebank_path: str) -> RuleStats:
         # Analyze tree structure
         for tree_data in item['trees']:
             if 'open_constituent_tree' in tree_data:
-                tree = TreeNode.from_dict(tree_data['open_constituent_tree'])
-                extract_rules_from_tree(tree, key, stats)
+                # Walk the raw dict; no TreeNode graph is needed here
+                extract_rules_from_dict(tree_data['open_constituent_tree'], key, stats)
                 analyzed += 1
 
         # Detect cadences
-        for cadence in detect_cadences(chords, key):
-            stats.cadences[cadence] += 1
+        stats.cadences.update(detect_cadences(chords, key))
+
+    return analyzed
+
+
+def _analyze_chunk(items: List[Dict]) -> Tuple[RuleStats, int]:
+    """Worker entry point: statistics for one contiguous slice of the treebank"""
+    stats = _new_stats()
+    return stats, _analyze_items(items, stats)
+
+
+# Below this many items, process start-up costs more than it saves
+_PARALLEL_MIN_ITEMS = 2000
+
+
+def analyze_treebank(treebank_path: str, workers: Optional[int] = None) -> RuleStats:
+    """Analyze entire treebank and extract rule statistics
+
+    Items are independent, so large treebanks are split across worker
+    processes (workers=None picks cpu_count for large inputs, 1 forces a
+    single process).
+    """
+    data = load_jht(treebank_path)
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(data) >= _PARALLEL_MIN_ITEMS else 1
+    workers = max(1, min(workers, len(data)))
+
+    stats = _new_stats()
+    if workers == 1:
+        analyzed = _analyze_items(data, stats)
+    else:
+        # Contiguous chunks merged in order keep counter insertion order
+        # (and so most_common tie-breaking) identical to a serial pass
+        size = -(-len(data) // workers)
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+
+        analyzed = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_stats, chunk_analyzed in executor.map(_analyze_chunk, chunks):
+                stats.binary_rules.update(chunk_stats.binary_rules)
+                stats.unary_rules.update(chunk_stats.unary_rules)
+                stats.terminal_rules.update(chunk_stats.terminal_rules)
+                stats.progressions.update(chunk_stats.progressions)
+                stats.cadences.update(chunk_stats.cadences)
+                analyzed += chunk_analyzed
 
     print(f"Analyzed {analyzed} trees from {len(data)} items")
     return stats
@@ -245,26 +425,30 @@ def compute_rule_probabilities(stats: RuleStats) -> Dict[str, float]:
     # Binary rules
     binary_total = sum(stats.binary_rules.values())
     if binary_total > 0:
-        for rule, count in stats.binary_rules.most_common():
-            probs[f"binary:{rule}"] = count / binary_total
+        inv = 1.0 / binary_total
+        probs.update({f"binary:{rule}": count * inv
+                      for rule, count in stats.binary_rules.items()})
 
     # Terminal rules
     term_total = sum(stats.terminal_rules.values())
     if term_total > 0:
-        for chord_type, count in stats.terminal_rules.most_common():
-            probs[f"terminal:{chord_type}"] = count / term_total
+        inv = 1.0 / term_total
+        probs.update({f"terminal:{chord_type}": count * inv
+                      for chord_type, count in stats.terminal_rules.items()})
 
-    # Progressions
+    # Progressions (top 20 only; nlargest avoids sorting the whole counter)
     prog_total = sum(stats.progressions.values())
     if prog_total > 0:
-        for prog, count in stats.progressions.most_common(20):
-            probs[f"progression:{prog}"] = count / prog_total
+        inv = 1.0 / prog_total
+        top = heapq.nlargest(20, stats.progressions.items(), key=itemgetter(1))
+        probs.update({f"progression:{prog}": count * inv for prog, count in top})
 
     # Cadences
     cad_total = sum(stats.cadences.values())
     if cad_total > 0:
-        for cad, count in stats.cadences.most_common():
-            probs[f"cadence:{cad}"] = count / cad_total
+        inv = 1.0 / cad_total
+        probs.update({f"cadence:{cad}": count * inv
+                      for cad, count in stats.cadences.items()})
 
     return probs
 
@@ -297,5 +481,8 @@ if __name__ == '__main__':
 
     print("\n=== Rule Probabilities (sample) ===")
     probs = compute_rule_probabilities(stats)
-    for k, v in list(probs.items())[:20]:
-        print(f"  {k}: {v:.4f}")
+    # Entries follow counter order, so rank the binary rules here
+    top = heapq.nlargest(20, stats.binary_rules.items(), key=itemgetter(1))
+    for rule, _ in top:
+        k = f"binary:{rule}"
+        print(f"  {k}: {probs[k]:.4f}")
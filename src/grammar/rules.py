@@ -1,8 +1,10 @@
 """PCFG Rule Structure for Jazz Harmony Grammar"""
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from dataclasses import dataclass, field, replace
+from enum import Enum, IntEnum, auto
+from itertools import accumulate
+from bisect import bisect_left
 from typing import List, Optional, Union, Dict, Tuple
 import random
 
@@ -27,6 +29,37 @@ class NonTerminal(Enum):
     PHRASE = "Ph"   # Phrase boundary
 
 
+class RuleTag(IntEnum):
+    """Integer tags for rules whose probability depends on style"""
+    NONE = 0
+    II_V = 1
+    D_TERMINAL = 2
+    TRITONE_SUB = 3
+    AUTHENTIC_CADENCE = 4
+    PROLONG = 5
+    PREP_CHAIN = 6
+    PREP_SECONDARY_DOM = 7
+
+
+_RULE_TAGS: Dict[Tuple[NonTerminal, str], RuleTag] = {
+    (NonTerminal.D, 'ii_v'): RuleTag.II_V,
+    (NonTerminal.D, 'd_terminal'): RuleTag.D_TERMINAL,
+    (NonTerminal.D, 'tritone_sub'): RuleTag.TRITONE_SUB,
+    (NonTerminal.T, 'authentic_cadence'): RuleTag.AUTHENTIC_CADENCE,
+    (NonTerminal.PREP, 'prep_chain'): RuleTag.PREP_CHAIN,
+    (NonTerminal.PREP, 'prep_secondary_dom'): RuleTag.PREP_SECONDARY_DOM,
+}
+
+
+def _rule_tag(lhs: NonTerminal, name: Optional[str]) -> RuleTag:
+    """Derive a rule's tag from its left-hand side and name"""
+    name = name or ''
+    # Every tonic prolongation rule shares one tag
+    if lhs == NonTerminal.T and 'prolong' in name:
+        return RuleTag.PROLONG
+    return _RULE_TAGS.get((lhs, name), RuleTag.NONE)
+
+
 class FunctionalCategory(Enum):
     """Functional categories for chord classification"""
     TONIC = "T"
@@ -35,15 +68,14 @@ class FunctionalCategory(Enum):
     APPLIED = "App"     # Applied/secondary dominant
 
 
-@dataclass
 class Symbol:
     """Base class for grammar symbols"""
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NTSymbol(Symbol):
-    """Non-terminal symbol wrapper"""
+    """Non-terminal symbol wrapper (immutable; instances are shared via _nt_symbol)"""
     nt: NonTerminal
     key: Optional[int] = None  # Key context (0-11), None = inherit
 
@@ -53,18 +85,45 @@ class NTSymbol(Symbol):
         return self.nt.value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TerminalSymbol(Symbol):
-    """Terminal symbol representing a chord function"""
+    """Terminal symbol representing a chord function (immutable; secondary_target derives from degree)"""
     degree: str             # Roman numeral (I, ii, V, bII, etc.)
     quality: str            # maj7, min7, 7, m7b5, etc.
     key_relative: bool = True  # Is degree relative to current key?
+    # Target degree of a secondary dominant ("V/ii" -> "ii"), parsed once
+    secondary_target: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if 'V/' in self.degree:
+            target = self.degree.split('/')[1]
+            if target in DEGREE_TO_SEMITONES:
+                object.__setattr__(self, 'secondary_target', target)
 
     def __str__(self) -> str:
         return f"{self.degree}{self.quality}"
 
 
-@dataclass
+# Shared NTSymbol instances per (non-terminal, key) pair
+_NT_CACHE: Dict[Tuple[NonTerminal, Optional[int]], NTSymbol] = {}
+
+
+def _nt_symbol(nt: NonTerminal, key: Optional[int]) -> NTSymbol:
+    """Get the shared NTSymbol for a non-terminal in a key context"""
+    sym = _NT_CACHE.get((nt, key))
+    if sym is None:
+        sym = _NT_CACHE[(nt, key)] = NTSymbol(nt, key)
+    return sym
+
+
+# Bumped on every GrammarRule.prob write; PCFG sampling caches built
+# under an older count are stale
+_PROB_WRITES = [0]
+
+
+@dataclass(slots=True)
 class GrammarRule:
     """A single PCFG production rule"""
     lhs: NonTerminal
@@ -72,10 +131,26 @@ class GrammarRule:
     prob: float = 1.0
     rule_type: RuleType = RuleType.STRUCTURAL
     name: Optional[str] = None
+    # Derived from lhs and name (and kept in step with them) unless given
+    # explicitly
+    tag: Optional[RuleTag] = field(default=None, repr=False, compare=False)
+    _tag_derived: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not 0.0 <= self.prob <= 1.0:
             raise ValueError(f"Probability must be in [0, 1], got {self.prob}")
+        if self.tag is None:
+            object.__setattr__(self, 'tag', _rule_tag(self.lhs, self.name))
+            object.__setattr__(self, '_tag_derived', True)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == 'prob':
+            _PROB_WRITES[0] += 1
+        elif name == 'tag':
+            object.__setattr__(self, '_tag_derived', False)
+        elif name in ('lhs', 'name') and getattr(self, '_tag_derived', False):
+            object.__setattr__(self, 'tag', _rule_tag(self.lhs, self.name))
 
     def __str__(self) -> str:
         rhs_str = " ".join(str(s) for s in self.rhs)
@@ -85,12 +160,10 @@ class GrammarRule:
         """Apply rule, propagating key context"""
         result = []
         for sym in self.rhs:
-            if isinstance(sym, NTSymbol):
+            if isinstance(sym, NTSymbol) and sym.key is None:
                 # Inherit key if not specified
-                new_key = sym.key if sym.key is not None else key
-                result.append(NTSymbol(sym.nt, new_key))
-            else:
-                result.append(sym)
+                sym = _nt_symbol(sym.nt, key)
+            result.append(sym)
         return result
 
 
@@ -99,43 +172,104 @@ class PCFG:
     """Probabilistic Context-Free Grammar for jazz harmony"""
     rules: Dict[NonTerminal, List[GrammarRule]] = field(default_factory=dict)
     start_symbol: NonTerminal = NonTerminal.S
+    # nt -> (live rule list, its length, rules, cumulative probabilities).
+    # The whole cache is dropped after any rule.prob write (see
+    # _PROB_WRITES); an entry is rebuilt if its list was replaced or resized.
+    # Swapping elements of a rule list in place isn't detected: call
+    # normalize() afterwards
+    _sampling_cache: Dict[
+        NonTerminal,
+        Tuple[List[GrammarRule], int, Tuple[GrammarRule, ...], Tuple[float, ...]]
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_version: int = field(default=-1, init=False, repr=False, compare=False)
 
     def add_rule(self, rule: GrammarRule):
         """Add a rule to the grammar"""
         if rule.lhs not in self.rules:
             self.rules[rule.lhs] = []
         self.rules[rule.lhs].append(rule)
+        self._sampling_cache.pop(rule.lhs, None)
 
     def get_rules(self, nt: NonTerminal) -> List[GrammarRule]:
         """Get all rules for a non-terminal"""
         return self.rules.get(nt, [])
 
+    def copy(self) -> PCFG:
+        """Copy with independent rule lists and rules (symbols are shared)"""
+        return PCFG(
+            # Derived tags stay derived in the copy
+            rules={
+                nt: [
+                    replace(r, rhs=list(r.rhs), tag=None if r._tag_derived else r.tag)
+                    for r in rule_list
+                ]
+                for nt, rule_list in self.rules.items()
+            },
+            start_symbol=self.start_symbol
+        )
+
     def normalize(self):
         """Normalize probabilities for each non-terminal"""
+        entries = {}
         for nt, rule_list in self.rules.items():
-            total = sum(r.prob for r in rule_list)
+            probs = [r.prob for r in rule_list]
+            total = sum(probs)
             if total > 0:
-                for r in rule_list:
-                    r.prob = r.prob / total
+                probs = [p / total for p in probs]
+                for r, p in zip(rule_list, probs):
+                    r.prob = p
+            entries[nt] = (rule_list, len(rule_list), tuple(rule_list), tuple(accumulate(probs)))
+
+        # Rebuild the sampling cache from the normalized values, stamped
+        # after this pass's own prob writes
+        self._sampling_cache = entries
+        self._cache_version = _PROB_WRITES[0]
+
+    def _sampling_entry(
+        self, nt: NonTerminal
+    ) -> Tuple[Tuple[GrammarRule, ...], Tuple[float, ...]]:
+        """Get (rules, cumulative probabilities) for nt, building it on first use"""
+        cache = self._sampling_cache
+        if self._cache_version != _PROB_WRITES[0]:
+            cache.clear()
+            self._cache_version = _PROB_WRITES[0]
+
+        live = self.rules.get(nt)
+        n = len(live) if live is not None else 0
+        entry = cache.get(nt)
+        if entry is None or entry[0] is not live or entry[1] != n:
+            rules = tuple(live) if live else ()
+            entry = cache[nt] = (
+                live, n, rules, tuple(accumulate(r.prob for r in rules))
+            )
+        return entry[2], entry[3]
 
     def sample_rule(self, nt: NonTerminal) -> Optional[GrammarRule]:
         """Sample a rule according to probabilities"""
-        rules = self.get_rules(nt)
+        rules, cum = self._sampling_entry(nt)
         if not rules:
             return None
 
-        probs = [r.prob for r in rules]
-        total = sum(probs)
+        total = cum[-1]
         if total == 0:
             return random.choice(rules)
 
-        r = random.random() * total
-        cumsum = 0
-        for rule, prob in zip(rules, probs):
-            cumsum += prob
-            if r <= cumsum:
-                return rule
-        return rules[-1]
+        # First rule whose cumulative probability reaches the draw, as in
+        # HarmonyGenerator._derive; r < total, so the index is in range
+        return rules[bisect_left(cum, random.random() * total)]
+
+    def sample_many(self, nt: NonTerminal, n: int) -> List[GrammarRule]:
+        """Sample n rules for nt (empty if nt has no rules)"""
+        rules, cum = self._sampling_entry(nt)
+        if not rules:
+            return []
+
+        total = cum[-1]
+        if total == 0:
+            return [random.choice(rules) for _ in range(n)]
+
+        rand = random.random
+        return [rules[bisect_left(cum, rand() * total)] for _ in range(n)]
 
     def __str__(self) -> str:
         lines = []
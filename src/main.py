@@ -71,7 +71,7 @@ def evaluate_command(args):
 
     if args.verbose:
         print("\n--- Voice Leading Analysis ---")
-        vl = analyze_progression(chords)
+        vl = analyze_progression(chords, detail=False)
         print(f"Total VL Cost: {vl.total_cost:.2f}")
         print(f"Smooth transitions: {vl.smooth_transitions}")
         print(f"Rough transitions: {vl.rough_transitions}")
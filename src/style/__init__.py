@@ -3,6 +3,6 @@
 from .vectors import StyleVector
 from .presets import (
     BEBOP, COOL, MODAL, POSTBOP, SWING, HARDBOP, FUSION, CONTEMPORARY, BLUES,
-    get_style, list_styles
+    get_style, list_styles, blend_presets
 )
-from .engine import StyleEngine, generate_styled_progression
+from .engine import StyleEngine, generate_styled_progression, generate_batch
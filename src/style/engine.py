@@ -1,24 +1,67 @@
 """Style Engine - Integrates style parameters with PCFG generation"""
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import functools
+import os
+from typing import Callable, Dict, List, Optional, Tuple
 import random
 
 from .vectors import StyleVector
-from .presets import get_style, BEBOP
+from .presets import get_style, BEBOP, STYLE_PRESETS, _key_templates
 from ..grammar.rules import (
     PCFG, GrammarRule, NonTerminal, NTSymbol, TerminalSymbol,
-    RuleType, create_base_grammar
+    RuleType, RuleTag, create_base_grammar
 )
 from ..grammar.generator import HarmonyGenerator, GeneratorConfig
-from ..substitution.tritone import TritoneSubstitution
-from ..substitution.backdoor import BackdoorSubstitution
-from ..substitution.coltrane import ColtraneSubstitution
+from ..substitution.tritone import TritoneSubstitution, tritone_substitute
+from ..substitution.backdoor import BackdoorSubstitution, backdoor_dominant
+from ..substitution.coltrane import ColtraneSubstitution, coltrane_over_ii_v_i
 from ..core.chord import ChordSymbol, ChordQuality
 from ..core.pitch import PitchClass
 
 
+# Style-dependent probability per rule tag; untagged rules keep their
+# base probability
+_STYLE_RULE_PROBS: Dict[RuleTag, Callable[[StyleVector], float]] = {
+    # Preparation rules follow ii_v_preference
+    RuleTag.II_V: lambda s: 0.4 * s.ii_v_preference,
+    RuleTag.D_TERMINAL: lambda s: 0.4 * (1 - s.ii_v_preference * 0.3),
+    RuleTag.TRITONE_SUB: lambda s: 0.15 * s.tritone_sub_prob,
+    # Prolongation and cadences
+    RuleTag.PROLONG: lambda s: 0.1 * (1 + s.prolongation_depth * 0.2),
+    RuleTag.AUTHENTIC_CADENCE: lambda s: 0.35 * s.ii_v_preference,
+    # Prep chain depth
+    RuleTag.PREP_CHAIN: lambda s: 0.15 * min(1.0, s.dominant_chain_depth / 4),
+    RuleTag.PREP_SECONDARY_DOM: lambda s: 0.15 * s.secondary_dom_prob,
+}
+
+
+def _pack_chord(chord: ChordSymbol) -> int:
+    """Pack a chord's root and quality into one int: (root << 4) | quality"""
+    return (chord.root._value << 4) | chord.quality._ord
+
+
+def _build_ii_v_i_codes(key: int) -> frozenset:
+    """Packed three-chord codes of every ii-V-I (I as maj7 or 6) in a key"""
+    ii = ((key + 2) % 12 << 4) | ChordQuality.MIN7._ord
+    v = ((key + 7) % 12 << 4) | ChordQuality.DOM7._ord
+    return frozenset(
+        (ii << 16) | (v << 8) | (key << 4) | quality._ord
+        for quality in (ChordQuality.MAJ7, ChordQuality.MAJ6)
+    )
+
+
+_DOM7_ORD = ChordQuality.DOM7._ord
+
+# Key names come from a small alphabet, so parse each one once
+_pitch_from_name = functools.lru_cache(maxsize=32)(PitchClass.from_name)
+
+# ii-V-I window codes indexed by key pitch class
+_II_V_I_CODES: Tuple[frozenset, ...] = tuple(_build_ii_v_i_codes(k) for k in range(12))
+
+
 def style_to_pcfg(style: StyleVector, base_grammar: Optional[PCFG] = None) -> PCFG:
     """Convert a style vector to PCFG rule probabilities.
 
@@ -27,34 +70,42 @@ def style_to_pcfg(style: StyleVector, base_grammar: Optional[PCFG] = None) -> PC
     """
     grammar = base_grammar or create_base_grammar()
 
-    # Adjust preparation rules based on ii_v_preference
-    for rule in grammar.get_rules(NonTerminal.D):
-        if rule.name == 'ii_v':
-            rule.prob = 0.4 * style.ii_v_preference
-        elif rule.name == 'd_terminal':
-            rule.prob = 0.4 * (1 - style.ii_v_preference * 0.3)
-        elif rule.name == 'tritone_sub':
-            rule.prob = 0.15 * style.tritone_sub_prob
-
-    # Adjust prolongation based on style
-    for rule in grammar.get_rules(NonTerminal.T):
-        if 'prolong' in (rule.name or ''):
-            rule.prob = 0.1 * (1 + style.prolongation_depth * 0.2)
-        elif rule.name == 'authentic_cadence':
-            rule.prob = 0.35 * style.ii_v_preference
-
-    # Adjust prep chain depth
-    for rule in grammar.get_rules(NonTerminal.PREP):
-        if rule.name == 'prep_chain':
-            rule.prob = 0.15 * min(1.0, style.dominant_chain_depth / 4)
-        elif rule.name == 'prep_secondary_dom':
-            rule.prob = 0.15 * style.secondary_dom_prob
+    # Single pass over the style-dependent non-terminals
+    for nt in (NonTerminal.D, NonTerminal.T, NonTerminal.PREP):
+        for rule in grammar.get_rules(nt):
+            fn = _STYLE_RULE_PROBS.get(rule.tag)
+            if fn is not None:
+                rule.prob = fn(style)
 
     # Normalize
     grammar.normalize()
     return grammar
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_style_grammar(style: StyleVector) -> PCFG:
+    """Normalized grammar for a non-preset style (e.g. a slider position)"""
+    return style_to_pcfg(style)
+
+
+# Presets are fixed, so build their grammars once at import and keep them
+# outside the LRU above, where a slider sweep would evict them
+_PRESET_PCFG: Dict[StyleVector, PCFG] = {
+    style: style_to_pcfg(style) for style in STYLE_PRESETS.values()
+}
+
+
+def _style_grammar(style: StyleVector) -> PCFG:
+    """Normalized grammar for a style, shared by every engine using that style.
+
+    Never handed out directly: StyleEngine.grammar gives callers a copy.
+    """
+    grammar = _PRESET_PCFG.get(style)
+    if grammar is None:
+        grammar = _cached_style_grammar(style)
+    return grammar
+
+
 @dataclass
 class StyledProgression:
     """A chord progression with style metadata"""
@@ -69,17 +120,40 @@ class StyleEngine:
 
     def __init__(self, style: Optional[StyleVector] = None):
         self.style = style or BEBOP
-        self.grammar = style_to_pcfg(self.style)
+        # Shared cached grammar until the public grammar attribute is used
+        self._grammar = _style_grammar(self.style)
+        self._owns_grammar = False
 
         # Initialize substitution handlers
         self.tritone_sub = TritoneSubstitution(self.style.tritone_sub_prob)
         self.backdoor_sub = BackdoorSubstitution(self.style.backdoor_prob)
         self.coltrane_sub = ColtraneSubstitution(self.style.coltrane_prob)
 
+        # Engine-local RNG for unseeded calls; never touches global random
+        self._rng = random.Random()
+
+    @property
+    def grammar(self) -> PCFG:
+        """The engine's grammar.
+
+        First access swaps the shared cached grammar for a private copy, so
+        edits only affect this engine.
+        """
+        if not self._owns_grammar:
+            self._grammar = self._grammar.copy()
+            self._owns_grammar = True
+        return self._grammar
+
+    @grammar.setter
+    def grammar(self, grammar: PCFG):
+        self._grammar = grammar
+        self._owns_grammar = True
+
     def set_style(self, style: StyleVector):
         """Update the style and regenerate grammar"""
         self.style = style
-        self.grammar = style_to_pcfg(style)
+        self._grammar = _style_grammar(style)
+        self._owns_grammar = False
         self.tritone_sub = TritoneSubstitution(style.tritone_sub_prob)
         self.backdoor_sub = BackdoorSubstitution(style.backdoor_prob)
         self.coltrane_sub = ColtraneSubstitution(style.coltrane_prob)
@@ -104,10 +178,11 @@ class StyleEngine:
         Returns:
             StyledProgression with chords and metadata
         """
-        if seed is not None:
-            random.seed(seed)
+        # A seeded call gets its own stream, so concurrent calls can't interfere;
+        # derivation and post-processing draw from it one after the other
+        rng = random.Random(seed) if seed is not None else self._rng
 
-        key_pc = PitchClass.from_name(key)
+        key_pc = _pitch_from_name(key)
 
         config = GeneratorConfig(
             max_depth=min(6, length // 2 + 2),
@@ -115,14 +190,14 @@ class StyleEngine:
             seed=seed
         )
 
-        generator = HarmonyGenerator(grammar=self.grammar, config=config)
+        generator = HarmonyGenerator(grammar=self._grammar, config=config, rng=rng)
         raw_chords = generator.generate()
 
         # Apply style-based post-processing
-        chords, subs = self._apply_substitutions(raw_chords, key_pc)
+        chords, subs = self._apply_substitutions(raw_chords, key_pc, rng)
 
         # Trim/pad to length
-        chords = self._adjust_length(chords, length, key_pc)
+        chords = self._adjust_length(chords, length, key_pc, rng)
 
         return StyledProgression(
             chords=chords,
@@ -134,168 +209,169 @@ class StyleEngine:
     def _apply_substitutions(
         self,
         chords: List[ChordSymbol],
-        key: PitchClass
+        key: PitchClass,
+        rng: Optional[random.Random] = None
     ) -> Tuple[List[ChordSymbol], List[str]]:
-        """Apply style-based substitutions to chord sequence"""
-        result = []
+        """Apply style-based substitutions to chord sequence.
+
+        Runs on packed (root << 4) | quality codes, inlining the Coltrane,
+        tritone and backdoor tests; ChordSymbols are only built for the
+        chords that actually change.
+        """
+        n = len(chords)
+        # Coltrane turns 3 chords into 7, so output never exceeds 3 * n;
+        # fill a preallocated list through a write index
+        result: List[Optional[ChordSymbol]] = [None] * (3 * n)
+        w = 0
         substitutions = []
 
+        # Resolve the draw function and probabilities once per call
+        rand = (rng or self._rng).random
+        tritone_sub_prob = self.style.tritone_sub_prob
+        backdoor_prob = self.backdoor_sub.probability
+        coltrane_prob = self.coltrane_sub.probability
+
+        # Find every ii-V-I start up front by comparing packed windows
+        packed = [_pack_chord(c) for c in chords]
+        codes = _II_V_I_CODES[key._value]
+        ii_v_i_starts = {
+            j for j in range(n - 2)
+            if ((packed[j] << 16) | (packed[j + 1] << 8) | packed[j + 2]) in codes
+        }
+
         i = 0
-        while i < len(chords):
+        while i < n:
             chord = chords[i]
 
-            # Check for ii-V-I pattern
-            if i + 2 < len(chords):
-                c1, c2, c3 = chords[i], chords[i + 1], chords[i + 2]
-                if self._is_ii_v_i(c1, c2, c3, key):
-                    # Maybe apply Coltrane changes
-                    expanded = self.coltrane_sub.maybe_expand_ii_v_i(
-                        c1, c2, c3, random.random()
-                    )
-                    if len(expanded) > 3:
-                        result.extend(expanded)
-                        substitutions.append('coltrane_ii_v_i')
-                        i += 3
-                        continue
+            # Check for ii-V-I pattern, maybe apply Coltrane changes
+            if i in ii_v_i_starts and rand() < coltrane_prob:
+                result[w:w + 7] = coltrane_over_ii_v_i(chord, chords[i + 1], chords[i + 2])
+                w += 7
+                substitutions.append('coltrane_ii_v_i')
+                i += 3
+                continue
 
             # Check for V-I pattern
-            if i + 1 < len(chords):
-                v, target = chords[i], chords[i + 1]
-                if v.quality == ChordQuality.DOM7:
-                    # Maybe apply tritone sub
-                    if random.random() < self.style.tritone_sub_prob:
-                        from ..substitution.tritone import tritone_substitute
-                        result.append(tritone_substitute(v))
-                        substitutions.append('tritone_sub')
-                        i += 1
-                        continue
-
-                    # Maybe apply backdoor
-                    new_v = self.backdoor_sub.maybe_substitute_dominant(
-                        v, target, random.random()
-                    )
-                    if new_v != v:
-                        result.append(new_v)
-                        substitutions.append('backdoor')
-                        i += 1
-                        continue
-
-            result.append(chord)
+            if i + 1 < n and packed[i] & 0xF == _DOM7_ORD:
+                # Maybe apply tritone sub
+                if rand() < tritone_sub_prob:
+                    result[w] = tritone_substitute(chord)
+                    w += 1
+                    substitutions.append('tritone_sub')
+                    i += 1
+                    continue
+
+                # Maybe apply backdoor when the dominant resolves up a fourth
+                if (rand() < backdoor_prob
+                        and ((packed[i + 1] >> 4) - (packed[i] >> 4)) % 12 == 5):
+                    result[w] = backdoor_dominant(chords[i + 1])
+                    w += 1
+                    substitutions.append('backdoor')
+                    i += 1
+                    continue
+
+            result[w] = chord
+            w += 1
             i += 1
 
+        del result[w:]
         return result, substitutions
 
-    def _is_ii_v_i(
-        self,
-        c1: ChordSymbol,
-        c2: ChordSymbol,
-        c3: ChordSymbol,
-        key: PitchClass
-    ) -> bool:
-        """Check if three chords form a ii-V-I pattern"""
-        # ii should be minor, root = key + 2
-        if c1.quality != ChordQuality.MIN7:
-            return False
-        if c1.root.interval_to(key) != 10:  # key is 2 semitones above ii
-            return False
-
-        # V should be dom7, root = key + 7
-        if c2.quality != ChordQuality.DOM7:
-            return False
-        if c2.root.interval_to(key) != 5:  # key is 5 semitones above V
-            return False
-
-        # I should be maj7, root = key
-        if c3.quality not in (ChordQuality.MAJ7, ChordQuality.MAJ6):
-            return False
-        if c3.root != key:
-            return False
-
-        return True
-
     def _adjust_length(
         self,
         chords: List[ChordSymbol],
         target: int,
-        key: PitchClass
+        key: PitchClass,
+        rng: Optional[random.Random] = None
     ) -> List[ChordSymbol]:
-        """Adjust progression to target length"""
-        if len(chords) >= target:
-            return chords[:target]
-
-        # Pad with appropriate chords
-        tonic = ChordSymbol(key, ChordQuality.MAJ7)
-        while len(chords) < target:
+        """Adjust progression to target length, trimming or padding in place"""
+        n = len(chords)
+        if n >= target:
+            del chords[target:]
+            return chords
+
+        # Pad with appropriate chords; a ii-V is only added when both fit,
+        # so the list never overshoots and needs no final slice
+        templates = _key_templates(key)
+        tonic, = templates['tonic']
+        ii, v = templates['ii_V_pad']
+        rand = (rng or self._rng).random
+        turnaround_prob = self.style.turnaround_prob
+        while n < target:
             # Add turnaround or repeat tonic
-            if random.random() < self.style.turnaround_prob and len(chords) < target - 1:
+            if rand() < turnaround_prob and n < target - 1:
                 # Add simple ii-V turnaround
-                ii_root = key.transpose(2)
-                v_root = key.transpose(7)
-                chords.append(ChordSymbol(ii_root, ChordQuality.MIN7))
-                if len(chords) < target:
-                    chords.append(ChordSymbol(v_root, ChordQuality.DOM7))
+                chords.append(ii)
+                chords.append(v)
+                n += 2
             else:
                 chords.append(tonic)
+                n += 1
 
-        return chords[:target]
+        return chords
 
-    def generate_turnaround(self, key: str = 'C') -> List[ChordSymbol]:
+    def generate_turnaround(self, key: str = 'C', seed: Optional[int] = None) -> List[ChordSymbol]:
         """Generate a style-appropriate turnaround"""
-        key_pc = PitchClass.from_name(key)
+        rng = random.Random(seed) if seed is not None else self._rng
+        templates = _key_templates(_pitch_from_name(key))
 
         # Basic I-vi-ii-V
-        i = ChordSymbol(key_pc, ChordQuality.MAJ7)
-        vi = ChordSymbol(key_pc.transpose(9), ChordQuality.MIN7)
-        ii = ChordSymbol(key_pc.transpose(2), ChordQuality.MIN7)
-        v = ChordSymbol(key_pc.transpose(7), ChordQuality.DOM7)
-
-        turnaround = [i, vi, ii, v]
+        turnaround = list(templates['I_vi_ii_V'])
+        v = turnaround[3]
 
         # Apply substitutions based on style
-        if random.random() < self.style.tritone_sub_prob:
-            from ..substitution.tritone import tritone_substitute
+        if rng.random() < self.style.tritone_sub_prob:
             turnaround[3] = tritone_substitute(v)
 
-        if random.random() < self.style.chromatic_approach:
+        if rng.random() < self.style.chromatic_approach:
             # Add chromatic approach to V
-            approach = ChordSymbol(key_pc.transpose(8), ChordQuality.DOM7)
-            turnaround.insert(3, approach)
+            turnaround.insert(3, templates['chromatic_approach'][0])
 
         return turnaround
 
-    def generate_blues_changes(self, key: str = 'C', bars: int = 12) -> List[ChordSymbol]:
+    def generate_blues_changes(
+        self,
+        key: str = 'C',
+        bars: int = 12,
+        seed: Optional[int] = None
+    ) -> List[ChordSymbol]:
         """Generate blues changes with style-appropriate substitutions"""
-        key_pc = PitchClass.from_name(key)
-
-        i7 = ChordSymbol(key_pc, ChordQuality.DOM7)
-        iv7 = ChordSymbol(key_pc.transpose(5), ChordQuality.DOM7)
-        v7 = ChordSymbol(key_pc.transpose(7), ChordQuality.DOM7)
+        templates = _key_templates(_pitch_from_name(key))
+        iv7, = templates['blues_IV7']
+        minor_iv, = templates['blues_minor_iv']
 
-        # Basic 12-bar blues
+        # Basic 12-bar blues, with each bar's tritone sub alongside
         if bars == 12:
-            changes = [
-                i7, iv7, i7, i7,
-                iv7, iv7, i7, i7,
-                v7, iv7, i7, v7
-            ]
+            changes = templates['blues_12']
+            tritone_changes = templates['blues_12_tritone']
         else:
-            changes = [i7] * bars
-
-        # Apply style substitutions
+            changes = templates['blues_I7'] * bars
+            tritone_changes = templates['blues_I7_tritone'] * bars
+
+        # Apply style substitutions; every template chord is a dominant,
+        # so a tritone sub only depends on the draw
+        rand = (random.Random(seed) if seed is not None else self._rng).random
+        tritone_sub_prob = self.style.tritone_sub_prob
+        minor_iv_prob = self.style.minor_iv_prob
         result = []
-        for i, chord in enumerate(changes):
-            if random.random() < self.style.tritone_sub_prob and chord.quality == ChordQuality.DOM7:
-                from ..substitution.tritone import tritone_substitute
-                result.append(tritone_substitute(chord))
-            elif random.random() < self.style.minor_iv_prob and chord == iv7:
+        for chord, tritone in zip(changes, tritone_changes):
+            if rand() < tritone_sub_prob:
+                result.append(tritone)
+            elif rand() < minor_iv_prob and chord == iv7:
                 # Minor iv
-                result.append(ChordSymbol(key_pc.transpose(5), ChordQuality.MIN7))
+                result.append(minor_iv)
             else:
                 result.append(chord)
 
         return result
 
 
+@functools.lru_cache(maxsize=32)
+def _get_engine(style: str) -> StyleEngine:
+    """Shared engine per style name; generate keeps no per-call state on it"""
+    return StyleEngine(get_style(style))
+
+
 def generate_styled_progression(
     style: str = 'bebop',
     length: int = 8,
@@ -303,6 +379,61 @@ def generate_styled_progression(
     seed: Optional[int] = None
 ) -> List[ChordSymbol]:
     """Convenience function to generate a styled progression"""
-    engine = StyleEngine(get_style(style))
-    result = engine.generate(length=length, key=key, seed=seed)
+    result = _get_engine(style).generate(length=length, key=key, seed=seed)
     return result.chords
+
+
+def _generate_chunk(
+    style: str,
+    length: int,
+    key: str,
+    seeds: List[int]
+) -> List[List[ChordSymbol]]:
+    """Worker entry point: one progression per seed, sharing one engine"""
+    engine = _get_engine(style)
+    return [engine.generate(length=length, key=key, seed=s).chords for s in seeds]
+
+
+# Below this many progressions, process start-up costs more than it saves
+_BATCH_PARALLEL_MIN = 500
+
+
+def generate_batch(
+    n: int,
+    style: str = 'bebop',
+    length: int = 8,
+    key: str = 'C',
+    seed: Optional[int] = None,
+    workers: Optional[int] = None
+) -> List[List[ChordSymbol]]:
+    """Generate n independent styled progressions.
+
+    Each progression gets its own seed drawn from `seed`, so a batch is
+    reproducible and comes out the same whether it runs in one process or
+    is split across workers (workers=None picks cpu_count for large
+    batches, 1 forces a single process).
+    """
+    get_style(style)  # Fail on unknown styles before starting any workers
+
+    seeder = random.Random(seed)
+    seeds = [seeder.getrandbits(32) for _ in range(n)]
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if n >= _BATCH_PARALLEL_MIN else 1
+    workers = max(1, min(workers, n))
+
+    if workers == 1:
+        return _generate_chunk(style, length, key, seeds)
+
+    size = -(-n // workers)
+    chunks = [seeds[i:i + size] for i in range(0, n, size)]
+
+    results: List[List[ChordSymbol]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_generate_chunk, style, length, key, chunk)
+            for chunk in chunks
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
@@ -1,6 +1,11 @@
 """Predefined Style Presets for Different Jazz Eras"""
 
-from .vectors import StyleVector
+from typing import Dict, Tuple
+
+from .vectors import StyleVector, _FIELDS, _INT_FIELD_INDICES, _get_fields
+from ..core.chord import ChordSymbol, ChordQuality
+from ..core.pitch import PitchClass
+from ..substitution.tritone import tritone_substitute
 
 
 # =============================================================================
@@ -218,6 +223,35 @@ STYLE_PRESETS = {
 }
 
 
+# Presets laid out as rows of field values in StyleVector field order
+_PRESET_INDEX: Dict[str, int] = {name: i for i, name in enumerate(STYLE_PRESETS)}
+PRESET_TABLE: Tuple[Tuple[float, ...], ...] = tuple(
+    _get_fields(style) for style in STYLE_PRESETS.values()
+)
+
+_ALIASES = {
+    'bop': 'bebop',
+    'hard': 'hardbop',
+    'post': 'postbop',
+    'modern': 'contemporary',
+    'coltrane': 'postbop',
+}
+
+
+def _preset_row(name: str) -> int:
+    """Resolve a preset name or alias to its PRESET_TABLE row"""
+    name_lower = name.lower().replace('-', '').replace('_', '').replace(' ', '')
+
+    # Handle aliases
+    name_lower = _ALIASES.get(name_lower, name_lower)
+
+    if name_lower not in _PRESET_INDEX:
+        available = ', '.join(STYLE_PRESETS.keys())
+        raise ValueError(f"Unknown style '{name}'. Available: {available}")
+
+    return _PRESET_INDEX[name_lower]
+
+
 def get_style(name: str) -> StyleVector:
     """Get a style preset by name.
 
@@ -230,27 +264,81 @@ def get_style(name: str) -> StyleVector:
     Raises:
         ValueError: If style name is not recognized
     """
-    name_lower = name.lower().replace('-', '').replace('_', '').replace(' ', '')
+    return StyleVector(*PRESET_TABLE[_preset_row(name)])
 
-    # Handle aliases
-    aliases = {
-        'bop': 'bebop',
-        'hard': 'hardbop',
-        'post': 'postbop',
-        'modern': 'contemporary',
-        'coltrane': 'postbop',
-    }
 
-    if name_lower in aliases:
-        name_lower = aliases[name_lower]
+def blend_presets(weights: Dict[str, float]) -> StyleVector:
+    """Blend several presets in one pass, e.g. {'bebop': 0.6, 'cool': 0.4}.
 
-    if name_lower not in STYLE_PRESETS:
-        available = ', '.join(STYLE_PRESETS.keys())
-        raise ValueError(f"Unknown style '{name}'. Available: {available}")
+    Args:
+        weights: Preset name (or alias) -> weight; weights should sum to 1
 
-    return STYLE_PRESETS[name_lower].copy()
+    Returns:
+        StyleVector with the weighted sum of the preset values
+
+    Raises:
+        ValueError: If a style name is not recognized or the blend
+            leaves a parameter out of range
+    """
+    values = [0.0] * len(_FIELDS)
+    for name, weight in weights.items():
+        row = PRESET_TABLE[_preset_row(name)]
+        for i, v in enumerate(row):
+            values[i] += weight * v
+    for idx in _INT_FIELD_INDICES:
+        values[idx] = int(values[idx])
+    return StyleVector(*values)
 
 
 def list_styles() -> list:
     """List all available style presets"""
     return list(STYLE_PRESETS.keys())
+
+
+# =============================================================================
+# Per-Key Chord Templates
+# =============================================================================
+
+def _build_key_templates(key: PitchClass) -> Dict[str, Tuple[ChordSymbol, ...]]:
+    """Build the fixed chord templates used by the style engine for one key"""
+    tonic = ChordSymbol(key, ChordQuality.MAJ7)
+    vi = ChordSymbol(key.transpose(9), ChordQuality.MIN7)
+    ii = ChordSymbol(key.transpose(2), ChordQuality.MIN7)
+    v = ChordSymbol(key.transpose(7), ChordQuality.DOM7)
+    i7 = ChordSymbol(key, ChordQuality.DOM7)
+    iv7 = ChordSymbol(key.transpose(5), ChordQuality.DOM7)
+    blues_12 = (
+        i7, iv7, i7, i7,
+        iv7, iv7, i7, i7,
+        v, iv7, i7, v,
+    )
+
+    return {
+        'tonic': (tonic,),
+        'ii_V_pad': (ii, v),
+        'I_vi_ii_V': (tonic, vi, ii, v),
+        'chromatic_approach': (ChordSymbol(key.transpose(8), ChordQuality.DOM7),),
+        'blues_I7': (i7,),
+        'blues_IV7': (iv7,),
+        'blues_minor_iv': (ChordSymbol(key.transpose(5), ChordQuality.MIN7),),
+        'blues_12': blues_12,
+        # Tritone subs aligned with the blues templates (all dominants)
+        'blues_I7_tritone': (tritone_substitute(i7),),
+        'blues_12_tritone': tuple(tritone_substitute(c) for c in blues_12),
+    }
+
+
+# Templates per key spelling; chord names follow the tonic's spelling, so
+# 'Bb' and 'A#' keep separate entries
+_KEY_TEMPLATES: Dict[str, Dict[str, Tuple[ChordSymbol, ...]]] = {
+    name: _build_key_templates(PitchClass.from_name(name))
+    for name in PitchClass._NAME_TO_VALUE
+}
+
+
+def _key_templates(key: PitchClass) -> Dict[str, Tuple[ChordSymbol, ...]]:
+    """Get the precomputed chord templates for a key"""
+    templates = _KEY_TEMPLATES.get(key.name())
+    if templates is None:
+        templates = _build_key_templates(key)
+    return templates
@@ -1,16 +1,17 @@
 """Style Vector Definition for Jazz Harmony Generation"""
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
 from typing import Dict, Optional
-import copy
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StyleVector:
     """Style parameters that control harmony generation.
 
     Each parameter affects the probability of certain harmonic choices.
+    Instances are immutable and hashable, so they can key caches.
     """
 
     # Substitution probabilities
@@ -42,17 +43,17 @@ class StyleVector:
     extension_level: float = 0.5        # Average extension level (9ths, 11ths, 13ths)
     alteration_prob: float = 0.2        # Probability of altered dominants
 
+    # Field dict built on the first to_dict call; only copies are handed out
+    _dict: Optional[Dict[str, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         self._validate()
 
     def _validate(self):
         """Validate all parameters are in valid ranges"""
-        for name in ['tritone_sub_prob', 'backdoor_prob', 'coltrane_prob',
-                     'ii_v_preference', 'secondary_dom_prob', 'modal_interchange',
-                     'minor_iv_prob', 'chromatic_approach', 'diminished_approach',
-                     'rhythm_density', 'turnaround_prob', 'extension_level',
-                     'alteration_prob']:
-            val = getattr(self, name)
+        for name, val in zip(_PROB_FIELDS, _get_probs(self)):
             if not 0.0 <= val <= 1.0:
                 raise ValueError(f"{name} must be in [0, 1], got {val}")
 
@@ -63,7 +64,7 @@ class StyleVector:
 
     def copy(self) -> StyleVector:
         """Create a copy of this style vector"""
-        return copy.deepcopy(self)
+        return replace(self)
 
     def blend(self, other: StyleVector, weight: float = 0.5) -> StyleVector:
         """Blend with another style vector.
@@ -77,43 +78,18 @@ class StyleVector:
         """
         w1, w2 = 1 - weight, weight
 
-        return StyleVector(
-            tritone_sub_prob=w1 * self.tritone_sub_prob + w2 * other.tritone_sub_prob,
-            backdoor_prob=w1 * self.backdoor_prob + w2 * other.backdoor_prob,
-            coltrane_prob=w1 * self.coltrane_prob + w2 * other.coltrane_prob,
-            ii_v_preference=w1 * self.ii_v_preference + w2 * other.ii_v_preference,
-            secondary_dom_prob=w1 * self.secondary_dom_prob + w2 * other.secondary_dom_prob,
-            modal_interchange=w1 * self.modal_interchange + w2 * other.modal_interchange,
-            minor_iv_prob=w1 * self.minor_iv_prob + w2 * other.minor_iv_prob,
-            chromatic_approach=w1 * self.chromatic_approach + w2 * other.chromatic_approach,
-            diminished_approach=w1 * self.diminished_approach + w2 * other.diminished_approach,
-            dominant_chain_depth=int(w1 * self.dominant_chain_depth + w2 * other.dominant_chain_depth),
-            prolongation_depth=int(w1 * self.prolongation_depth + w2 * other.prolongation_depth),
-            rhythm_density=w1 * self.rhythm_density + w2 * other.rhythm_density,
-            turnaround_prob=w1 * self.turnaround_prob + w2 * other.turnaround_prob,
-            extension_level=w1 * self.extension_level + w2 * other.extension_level,
-            alteration_prob=w1 * self.alteration_prob + w2 * other.alteration_prob,
-        )
+        values = [w1 * a + w2 * b for a, b in zip(_get_fields(self), _get_fields(other))]
+        for idx in _INT_FIELD_INDICES:
+            values[idx] = int(values[idx])
+        return StyleVector(*values)
 
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary"""
-        return {
-            'tritone_sub_prob': self.tritone_sub_prob,
-            'backdoor_prob': self.backdoor_prob,
-            'coltrane_prob': self.coltrane_prob,
-            'ii_v_preference': self.ii_v_preference,
-            'secondary_dom_prob': self.secondary_dom_prob,
-            'modal_interchange': self.modal_interchange,
-            'minor_iv_prob': self.minor_iv_prob,
-            'chromatic_approach': self.chromatic_approach,
-            'diminished_approach': self.diminished_approach,
-            'dominant_chain_depth': self.dominant_chain_depth,
-            'prolongation_depth': self.prolongation_depth,
-            'rhythm_density': self.rhythm_density,
-            'turnaround_prob': self.turnaround_prob,
-            'extension_level': self.extension_level,
-            'alteration_prob': self.alteration_prob,
-        }
+        d = self._dict
+        if d is None:
+            d = dict(zip(_FIELDS, _get_fields(self)))
+            object.__setattr__(self, '_dict', d)
+        return d.copy()
 
     @classmethod
     def from_dict(cls, d: Dict[str, float]) -> StyleVector:
@@ -150,3 +126,12 @@ class StyleVector:
             parts.append("altered dominants")
 
         return ", ".join(parts) if parts else "standard jazz harmony"
+
+
+# Field order of StyleVector and bulk getters returning values as tuples
+_FIELDS = tuple(f.name for f in fields(StyleVector) if f.init)
+_INT_FIELDS = ('dominant_chain_depth', 'prolongation_depth')
+_INT_FIELD_INDICES = tuple(_FIELDS.index(name) for name in _INT_FIELDS)
+_PROB_FIELDS = tuple(name for name in _FIELDS if name not in _INT_FIELDS)
+_get_fields = attrgetter(*_FIELDS)
+_get_probs = attrgetter(*_PROB_FIELDS)
@@ -1,27 +1,17 @@
 """Coltrane Changes (Giant Steps / Countdown substitutions)"""
 
 from __future__ import annotations
-from typing import List
+from typing import List, Tuple
 from ..core.chord import ChordSymbol, ChordQuality
 from ..core.pitch import PitchClass
 
 
-def coltrane_substitution(tonic: ChordSymbol) -> List[ChordSymbol]:
-    """Generate Coltrane changes for a tonic chord.
-
-    The Coltrane substitution divides the octave into three equal parts
-    (major thirds) and creates a cycle of dominant resolutions.
-
-    I -> III7 -> bVI -> bII7 (-> V7 -> I)
-
-    In C: Cmaj7 -> E7 -> Abmaj7 -> B7 -> Ebmaj7 -> G7 -> Cmaj7
-
-    This creates three key centers a major third apart.
-    """
-    root = tonic.root
+def _build_coltrane_cycle(root_value: int) -> Tuple[ChordSymbol, ...]:
+    """Coltrane cycle on an unspelled tonic root: Cmaj7 B7 Emaj7 Eb7 Abmaj7 G7 Cmaj7"""
+    root = PitchClass.from_value(root_value)
+    i_1 = ChordSymbol(root, ChordQuality.MAJ7)                  # Cmaj7
 
     # Three key centers (major 3rds apart)
-    center1 = root  # C
     center2 = root.transpose(4)  # E (major 3rd up)
     center3 = root.transpose(8)  # Ab (another major 3rd up)
 
@@ -29,18 +19,50 @@ def coltrane_substitution(tonic: ChordSymbol) -> List[ChordSymbol]:
     # V of center1 (C) = G7
     # V of center2 (E) = B7
     # V of center3 (Ab) = Eb7
+    return (
+        i_1,
+        ChordSymbol(center2.transpose(7), ChordQuality.DOM7),   # B7
+        ChordSymbol(center2, ChordQuality.MAJ7),                # Emaj7
+        ChordSymbol(center3.transpose(7), ChordQuality.DOM7),   # Eb7
+        ChordSymbol(center3, ChordQuality.MAJ7),                # Abmaj7
+        ChordSymbol(root.transpose(7), ChordQuality.DOM7),      # G7
+        i_1,
+    )
+
+
+# Full cycles and the Countdown chords between ii and V (Eb7 Abmaj7
+# B7 Emaj7 in C), indexed by tonic root value
+_COLTRANE_CYCLES: Tuple[Tuple[ChordSymbol, ...], ...] = tuple(
+    _build_coltrane_cycle(v) for v in range(12)
+)
+_COUNTDOWN_INTERIORS: Tuple[Tuple[ChordSymbol, ...], ...] = tuple(
+    (v_of_3, i_3, v_of_2, i_2)
+    for _, v_of_2, i_2, v_of_3, i_3, _, _ in _COLTRANE_CYCLES
+)
 
-    v_of_1 = ChordSymbol(root.transpose(7), ChordQuality.DOM7)      # G7
-    v_of_2 = ChordSymbol(center2.transpose(7), ChordQuality.DOM7)   # B7
-    v_of_3 = ChordSymbol(center3.transpose(7), ChordQuality.DOM7)   # Eb7
 
-    i_1 = ChordSymbol(center1, ChordQuality.MAJ7)   # Cmaj7
-    i_2 = ChordSymbol(center2, ChordQuality.MAJ7)   # Emaj7
-    i_3 = ChordSymbol(center3, ChordQuality.MAJ7)   # Abmaj7
+def coltrane_substitution(tonic: ChordSymbol) -> List[ChordSymbol]:
+    """Generate Coltrane changes for a tonic chord.
+
+    The Coltrane substitution divides the octave into three equal parts
+    (major thirds) and creates a cycle of dominant resolutions.
+
+    I -> III7 -> bVI -> bII7 (-> V7 -> I)
 
+    In C: Cmaj7 -> E7 -> Abmaj7 -> B7 -> Ebmaj7 -> G7 -> Cmaj7
+
+    This creates three key centers a major third apart.
+    """
     # Full Coltrane cycle: starting from I
     # Cmaj7 -> B7 -> Emaj7 -> Eb7 -> Abmaj7 -> G7 -> Cmaj7
-    return [i_1, v_of_2, i_2, v_of_3, i_3, v_of_1, i_1]
+    root = tonic.root
+    cycle = _COLTRANE_CYCLES[root._value]
+    if root._spelling is None:
+        return list(cycle)
+
+    # A spelled tonic keeps its own name at both ends of the cycle
+    i_1 = ChordSymbol(root, ChordQuality.MAJ7)
+    return [i_1, *cycle[1:6], i_1]
 
 
 def coltrane_over_ii_v_i(ii: ChordSymbol, v: ChordSymbol, i: ChordSymbol) -> List[ChordSymbol]:
@@ -53,21 +75,7 @@ def coltrane_over_ii_v_i(ii: ChordSymbol, v: ChordSymbol, i: ChordSymbol) -> Lis
     Or simplified for 2 bars:
     Dm7 Eb7 | Abmaj7 B7 | Emaj7 G7 | Cmaj7
     """
-    root = i.root
-
-    # Key centers
-    center2 = root.transpose(4)  # Major 3rd up
-    center3 = root.transpose(8)  # 2 major 3rds up
-
-    return [
-        ii,
-        ChordSymbol(center3.transpose(7), ChordQuality.DOM7),  # Eb7
-        ChordSymbol(center3, ChordQuality.MAJ7),               # Abmaj7
-        ChordSymbol(center2.transpose(7), ChordQuality.DOM7),  # B7
-        ChordSymbol(center2, ChordQuality.MAJ7),               # Emaj7
-        v,                                                      # G7
-        i                                                       # Cmaj7
-    ]
+    return [ii, *_COUNTDOWN_INTERIORS[i.root._value], v, i]
 
 
 def thirds_cycle(start: ChordSymbol, direction: str = 'down', steps: int = 3) -> List[ChordSymbol]:
@@ -15,13 +15,9 @@ def tritone_substitute(chord: ChordSymbol) -> ChordSymbol:
     - The guide tones (3rd and 7th) are swapped
     - G7 (B, F) -> Db7 (F, Cb/B) - same tritone interval
     """
-    new_root = chord.root.transpose(6)  # Tritone = 6 semitones
-    return ChordSymbol(
-        root=new_root,
-        quality=chord.quality,
-        extensions=chord.extensions.copy(),
-        alterations=chord.alterations.copy()
-    )
+    # Root moves by a tritone (6 semitones); ChordSymbol is immutable, so
+    # the extensions and alterations are shared rather than copied
+    return chord.tritone_substitute()
 
 
 def reverse_tritone_substitute(chord: ChordSymbol) -> ChordSymbol:
@@ -29,9 +25,15 @@ def reverse_tritone_substitute(chord: ChordSymbol) -> ChordSymbol:
     return tritone_substitute(chord)
 
 
+# Whether a tritone sub applies, per quality ordinal (dominant and sus4)
+_TRITONE_SUB_OK = tuple(
+    q in (ChordQuality.DOM7, ChordQuality.SUS4) for q in ChordQuality
+)
+
+
 def can_apply_tritone_sub(chord: ChordSymbol) -> bool:
     """Check if tritone substitution can be applied"""
-    return chord.quality in (ChordQuality.DOM7, ChordQuality.SUS4)
+    return _TRITONE_SUB_OK[chord.quality._ord]
 
 
 def apply_tritone_to_ii_v(ii: ChordSymbol, v: ChordSymbol) -> tuple[ChordSymbol, ChordSymbol]:
@@ -53,14 +55,18 @@ def tritone_sub_chain(dominants: List[ChordSymbol], sub_indices: Optional[List[i
 
     Example: G7 - C7 - F7 with sub_indices=[1] becomes G7 - Gb7 - F7
     """
-    result = []
-    sub_set = set(sub_indices) if sub_indices else set()
+    result = list(dominants)
+    if not sub_indices:
+        return result
 
-    for i, chord in enumerate(dominants):
-        if i in sub_set and can_apply_tritone_sub(chord):
-            result.append(tritone_substitute(chord))
-        else:
-            result.append(chord)
+    # Only the selected positions are visited; indices outside the chain
+    # never match, and a repeated index just recomputes the same sub
+    n = len(dominants)
+    for i in sub_indices:
+        if 0 <= i < n:
+            chord = dominants[i]
+            if can_apply_tritone_sub(chord):
+                result[i] = tritone_substitute(chord)
 
     return result
 
@@ -87,7 +93,10 @@ class TritoneSubstitution:
         random_vals: List[float]
     ) -> List[ChordSymbol]:
         """Apply tritone substitution to a progression"""
-        result = []
-        for chord, rv in zip(chords, random_vals):
-            result.append(self.maybe_substitute(chord, rv))
-        return result
+        # Same test as maybe_substitute, without a method call per chord
+        probability = self.probability
+        return [
+            tritone_substitute(chord)
+            if rv < probability and can_apply_tritone_sub(chord) else chord
+            for chord, rv in zip(chords, random_vals)
+        ]
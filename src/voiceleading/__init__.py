@@ -4,6 +4,7 @@ from .guidetone import (
     voice_leading_cost,
     progression_voice_leading_cost,
     average_voice_leading_cost,
+    voice_leading_stats,
     analyze_progression,
     optimize_progression,
     is_smooth_progression,
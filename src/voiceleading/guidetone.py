@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+import functools
 from typing import List, Optional, Tuple, Dict
 from enum import Enum
 
 from ..core.chord import ChordSymbol, ChordQuality
-from ..core.pitch import PitchClass
+from ..core.pitch import PitchClass, _PC_CACHE
 
 
 class VoiceLeadingType(Enum):
@@ -17,7 +18,7 @@ class VoiceLeadingType(Enum):
     LEAP = "leap"               # Fourth or larger
 
 
-@dataclass
+@dataclass(slots=True)
 class GuideTone:
     """A guide tone (3rd or 7th of a chord)"""
     pitch: PitchClass
@@ -25,7 +26,7 @@ class GuideTone:
     chord: ChordSymbol
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceLeadingConnection:
     """Connection between two guide tones"""
     from_tone: GuideTone
@@ -35,25 +36,86 @@ class VoiceLeadingConnection:
     cost: float             # Lower is better
 
 
+# Minimum interval (0-6) between every pair of pitch classes, at a * 12 + b
+_MIN_INTERVAL = bytes(
+    min((b - a) % 12, (a - b) % 12) for a in range(12) for b in range(12)
+)
+
+
 def min_interval(pc1: PitchClass, pc2: PitchClass) -> int:
     """Calculate minimum interval between two pitch classes (0-6 semitones)"""
-    forward = pc1.interval_to(pc2)
-    backward = pc2.interval_to(pc1)
-    return min(forward, backward)
+    return _MIN_INTERVAL[pc1._value * 12 + pc2._value]
+
+
+# Motion type for each interval 0-12
+_MOTION_BY_INTERVAL = (
+    (VoiceLeadingType.COMMON_TONE,)
+    + (VoiceLeadingType.STEP,) * 2
+    + (VoiceLeadingType.SKIP,) * 2
+    + (VoiceLeadingType.LEAP,) * 8
+)
 
 
 def classify_motion(interval: int) -> VoiceLeadingType:
     """Classify the type of motion based on interval"""
-    if interval == 0:
-        return VoiceLeadingType.COMMON_TONE
+    if 0 <= interval <= 12:
+        return _MOTION_BY_INTERVAL[interval]
     elif interval <= 2:
         return VoiceLeadingType.STEP
-    elif interval <= 4:
-        return VoiceLeadingType.SKIP
     else:
         return VoiceLeadingType.LEAP
 
 
+# (third, seventh) offsets from the root per quality ordinal; qualities
+# without a seventh use their unaltered fifth
+_GUIDE_OFFSETS = tuple(
+    (q._third, q._seventh if q._seventh is not None else q._fifth)
+    for q in ChordQuality
+)
+
+
+def _guide_tone_values(chord: ChordSymbol) -> Tuple[int, int]:
+    """(third, seventh) pitch class ints, using the fifth when there's no seventh"""
+    root = chord.root._value
+    quality = chord.quality
+    third, seventh = _GUIDE_OFFSETS[quality._ord]
+    if quality._seventh is None and '5' in chord.alterations:
+        return (root + third) % 12, chord.fifth._value
+    return (root + third) % 12, (root + seventh) % 12
+
+
+def _pair_cost(t1: int, s1: int, t2: int, s2: int) -> int:
+    """Voice leading cost of one transition between (third, seventh) int pairs"""
+    mi = _MIN_INTERVAL
+    t1 *= 12
+    s1 *= 12
+    cost1 = mi[t1 + t2] + mi[s1 + s2]
+    cost2 = mi[t1 + s2] + mi[s1 + t2]
+    return cost1 if cost1 < cost2 else cost2
+
+
+# Bounded by 12 roots x 11 qualities squared, so the cache needs no limit
+@functools.lru_cache(maxsize=None)
+def _cached_pair_cost(root1: int, quality1: int, root2: int, quality2: int) -> int:
+    """Guide-tone voice leading cost between two (root, quality ordinal) shapes"""
+    third1, seventh1 = _GUIDE_OFFSETS[quality1]
+    third2, seventh2 = _GUIDE_OFFSETS[quality2]
+    return _pair_cost(
+        (root1 + third1) % 12, (root1 + seventh1) % 12,
+        (root2 + third2) % 12, (root2 + seventh2) % 12
+    )
+
+
+# With equal qualities the cost only depends on the root interval: parallel
+# motion moves both guide tones by it, and the exchange is fixed per quality.
+# Indexed by quality ordinal * 12 + ascending root interval
+_SAME_QUALITY_COST = bytes(
+    _pair_cost(third, seventh, (third + d) % 12, (seventh + d) % 12)
+    for third, seventh in _GUIDE_OFFSETS
+    for d in range(12)
+)
+
+
 def voice_leading_cost(chord1: ChordSymbol, chord2: ChordSymbol) -> float:
     """Calculate voice leading cost between two chords based on guide tones.
 
@@ -62,43 +124,42 @@ def voice_leading_cost(chord1: ChordSymbol, chord2: ChordSymbol) -> float:
 
     Based on Smither (2019) guide-tone voice leading theory.
     """
-    third1 = chord1.third
-    seventh1 = chord1.seventh
-    third2 = chord2.third
-    seventh2 = chord2.seventh
-
-    # If no seventh, use fifth as substitute
-    if seventh1 is None:
-        seventh1 = chord1.fifth
-    if seventh2 is None:
-        seventh2 = chord2.fifth
-
-    # Calculate all possible voice leading paths
-    # Path 1: 3rd -> 3rd, 7th -> 7th
-    cost1 = min_interval(third1, third2) + min_interval(seventh1, seventh2)
+    quality1 = chord1.quality
+    quality2 = chord2.quality
+
+    # An altered fifth standing in for a missing seventh isn't captured by
+    # (root, quality), so cost those pairs directly
+    if ((quality1._seventh is None and '5' in chord1.alterations)
+            or (quality2._seventh is None and '5' in chord2.alterations)):
+        return _pair_cost(*_guide_tone_values(chord1), *_guide_tone_values(chord2))
+
+    if quality1 is quality2:
+        return _SAME_QUALITY_COST[
+            quality1._ord * 12 + (chord2.root._value - chord1.root._value) % 12
+        ]
+
+    return _cached_pair_cost(
+        chord1.root._value, quality1._ord, chord2.root._value, quality2._ord
+    )
 
-    # Path 2: 3rd -> 7th, 7th -> 3rd (voice exchange)
-    cost2 = min_interval(third1, seventh2) + min_interval(seventh1, third2)
 
-    return min(cost1, cost2)
+def _guide_tone_pair(chord: ChordSymbol, third: int, seventh: int) -> Tuple[GuideTone, GuideTone]:
+    """(third, seventh) GuideTones of a chord from its extracted guide-tone ints"""
+    return (GuideTone(_PC_CACHE[third], 'third', chord),
+            GuideTone(_PC_CACHE[seventh], 'seventh', chord))
 
 
-def analyze_voice_leading(
-    chord1: ChordSymbol,
-    chord2: ChordSymbol
+def _connect_guide_tones(
+    from_tones: Tuple[GuideTone, GuideTone],
+    to_tones: Tuple[GuideTone, GuideTone]
 ) -> List[VoiceLeadingConnection]:
-    """Analyze voice leading connections between two chords"""
+    """Connections 3->3, 3->7, 7->3, 7->7 between two chords' guide tones"""
     connections = []
 
-    gt1_3 = GuideTone(chord1.third, 'third', chord1)
-    gt1_7 = GuideTone(chord1.seventh or chord1.fifth, 'seventh', chord1)
-    gt2_3 = GuideTone(chord2.third, 'third', chord2)
-    gt2_7 = GuideTone(chord2.seventh or chord2.fifth, 'seventh', chord2)
-
-    for from_gt in [gt1_3, gt1_7]:
-        for to_gt in [gt2_3, gt2_7]:
-            interval = min_interval(from_gt.pitch, to_gt.pitch)
-            motion = classify_motion(interval)
+    for from_gt in from_tones:
+        for to_gt in to_tones:
+            interval = _MIN_INTERVAL[from_gt.pitch._value * 12 + to_gt.pitch._value]
+            motion = _MOTION_BY_INTERVAL[interval]
             cost = interval * (1.0 if motion in (VoiceLeadingType.COMMON_TONE, VoiceLeadingType.STEP) else 1.5)
 
             connections.append(VoiceLeadingConnection(
@@ -112,16 +173,57 @@ def analyze_voice_leading(
     return connections
 
 
+def analyze_voice_leading(
+    chord1: ChordSymbol,
+    chord2: ChordSymbol
+) -> List[VoiceLeadingConnection]:
+    """Analyze voice leading connections between two chords"""
+    return _connect_guide_tones(
+        _guide_tone_pair(chord1, *_guide_tone_values(chord1)),
+        _guide_tone_pair(chord2, *_guide_tone_values(chord2))
+    )
+
+
+def _extract_guide_tones(chords: List[ChordSymbol]) -> Tuple[List[int], List[int]]:
+    """Project a progression onto guide-tone pitch class ints in one pass.
+
+    Returns (thirds, sevenths); chords without a seventh use their fifth,
+    matching voice_leading_cost.
+    """
+    thirds = []
+    sevenths = []
+    for chord in chords:
+        third, seventh = _guide_tone_values(chord)
+        thirds.append(third)
+        sevenths.append(seventh)
+    return thirds, sevenths
+
+
+def _transition_costs(thirds: List[int], sevenths: List[int]) -> List[int]:
+    """Guide-tone voice leading cost of every transition, from extracted tones"""
+    mi = _MIN_INTERVAL
+    costs = []
+    t1 = thirds[0] * 12
+    s1 = sevenths[0] * 12
+    for t2, s2 in zip(thirds[1:], sevenths[1:]):
+        # Path 1: 3rd -> 3rd, 7th -> 7th
+        cost1 = mi[t1 + t2] + mi[s1 + s2]
+
+        # Path 2: 3rd -> 7th, 7th -> 3rd (voice exchange)
+        cost2 = mi[t1 + s2] + mi[s1 + t2]
+
+        costs.append(cost1 if cost1 < cost2 else cost2)
+        t1 = t2 * 12
+        s1 = s2 * 12
+    return costs
+
+
 def progression_voice_leading_cost(chords: List[ChordSymbol]) -> float:
     """Calculate total voice leading cost for a progression"""
     if len(chords) < 2:
         return 0.0
 
-    total = 0.0
-    for i in range(len(chords) - 1):
-        total += voice_leading_cost(chords[i], chords[i + 1])
-
-    return total
+    return float(sum(_transition_costs(*_extract_guide_tones(chords))))
 
 
 def average_voice_leading_cost(chords: List[ChordSymbol]) -> float:
@@ -132,6 +234,18 @@ def average_voice_leading_cost(chords: List[ChordSymbol]) -> float:
     return progression_voice_leading_cost(chords) / (len(chords) - 1)
 
 
+def voice_leading_stats(chords: List[ChordSymbol]) -> Tuple[float, float]:
+    """Calculate (average cost, smooth ratio) in a single pass over transitions"""
+    n = len(chords)
+    if n < 2:
+        return 0.0, 1.0
+
+    costs = _transition_costs(*_extract_guide_tones(chords))
+    smooth_count = sum(1 for cost in costs if cost <= 2)
+
+    return float(sum(costs)) / (n - 1), smooth_count / (n - 1)
+
+
 def find_smoothest_voicing(
     chord: ChordSymbol,
     prev_guide_tones: Tuple[PitchClass, PitchClass]
@@ -140,8 +254,9 @@ def find_smoothest_voicing(
 
     Returns the (3rd, 7th) voicing that minimizes voice leading distance.
     """
-    third = chord.third
-    seventh = chord.seventh or chord.fifth
+    third, seventh = _guide_tone_values(chord)
+    third = _PC_CACHE[third]
+    seventh = _PC_CACHE[seventh]
 
     prev_3, prev_7 = prev_guide_tones
 
@@ -157,35 +272,58 @@ def find_smoothest_voicing(
         return (seventh, third)
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceLeadingAnalysis:
     """Complete voice leading analysis for a progression"""
     chords: List[ChordSymbol]
-    connections: List[List[VoiceLeadingConnection]]
+    connections: Optional[List[List[VoiceLeadingConnection]]]  # None for a summary
     total_cost: float
     average_cost: float
     smooth_transitions: int  # Transitions with cost <= 2
     rough_transitions: int   # Transitions with cost > 4
 
 
-def analyze_progression(chords: List[ChordSymbol]) -> VoiceLeadingAnalysis:
-    """Perform complete voice leading analysis on a progression"""
-    all_connections = []
+def analyze_progression(chords: List[ChordSymbol], detail: bool = True) -> VoiceLeadingAnalysis:
+    """Perform complete voice leading analysis on a progression.
+
+    With detail=False only the summary is computed and connections is None.
+    """
+    n = len(chords)
+    all_connections: Optional[List[List[VoiceLeadingConnection]]] = [] if detail else None
+    total = 0
     smooth = 0
     rough = 0
 
-    for i in range(len(chords) - 1):
-        connections = analyze_voice_leading(chords[i], chords[i + 1])
-        all_connections.append(connections)
-
-        cost = voice_leading_cost(chords[i], chords[i + 1])
-        if cost <= 2:
-            smooth += 1
-        elif cost > 4:
-            rough += 1
-
-    total = progression_voice_leading_cost(chords)
-    avg = average_voice_leading_cost(chords)
+    if n > 1 and not detail:
+        for cost in _transition_costs(*_extract_guide_tones(chords)):
+            total += cost
+            if cost <= 2:
+                smooth += 1
+            elif cost > 4:
+                rough += 1
+    elif n > 1:
+        # Guide tones are extracted once and shared by both neighbouring
+        # transitions; each transition's cost falls out of its connections
+        thirds, sevenths = _extract_guide_tones(chords)
+        prev_tones = _guide_tone_pair(chords[0], thirds[0], sevenths[0])
+        for i in range(1, n):
+            tones = _guide_tone_pair(chords[i], thirds[i], sevenths[i])
+            connections = _connect_guide_tones(prev_tones, tones)
+            all_connections.append(connections)
+            prev_tones = tones
+
+            # 3rd -> 3rd + 7th -> 7th, or the voice exchange 3rd -> 7th + 7th -> 3rd
+            cost1 = connections[0].interval + connections[3].interval
+            cost2 = connections[1].interval + connections[2].interval
+            cost = cost1 if cost1 < cost2 else cost2
+            total += cost
+            if cost <= 2:
+                smooth += 1
+            elif cost > 4:
+                rough += 1
+
+    total = float(total)
+    avg = total / (n - 1) if n > 1 else 0.0
 
     return VoiceLeadingAnalysis(
         chords=chords,
@@ -203,36 +341,62 @@ def optimize_progression(
 ) -> Tuple[List[ChordSymbol], float]:
     """Optimize a progression for better voice leading.
 
-    Uses local search to find substitutions that improve voice leading.
+    Each chord is kept or, if it's a dominant, replaced by its tritone sub;
+    the cost is pairwise, so a Viterbi pass over the two-state trellis finds
+    the cheapest combination exactly in O(N). Ties keep the original chord.
+    max_iterations is only kept for compatibility (<= 0 disables the search).
     Returns the optimized progression and its cost.
     """
     from ..substitution.tritone import tritone_substitute, can_apply_tritone_sub
 
-    current = chords.copy()
-    current_cost = progression_voice_leading_cost(current)
-
-    for _ in range(max_iterations):
-        improved = False
-
-        for i in range(len(current)):
-            chord = current[i]
-
-            # Try tritone substitution
-            if can_apply_tritone_sub(chord):
-                test = current.copy()
-                test[i] = tritone_substitute(chord)
-                new_cost = progression_voice_leading_cost(test)
-
-                if new_cost < current_cost:
-                    current = test
-                    current_cost = new_cost
-                    improved = True
-                    break
-
-        if not improved:
-            break
-
-    return current, current_cost
+    n = len(chords)
+    if n < 2 or max_iterations <= 0:
+        return chords.copy(), progression_voice_leading_cost(chords)
+
+    # A tritone sub keeps quality and alterations, so it moves the third
+    # and seventh (or fifth) by 6; state 0 = original, state 1 = sub
+    thirds, sevenths = _extract_guide_tones(chords)
+    states = []
+    for chord, third, seventh in zip(chords, thirds, sevenths):
+        if can_apply_tritone_sub(chord):
+            states.append(((third, seventh), ((third + 6) % 12, (seventh + 6) % 12)))
+        else:
+            states.append(((third, seventh),))
+
+    # Forward pass: best[s] = cheapest cost of a path ending in state s
+    best = [0] * len(states[0])
+    back: List[List[int]] = []
+    for i in range(1, n):
+        prev_states = states[i - 1]
+        step_best = []
+        step_back = []
+        for t2, s2 in states[i]:
+            choice = 0
+            cost = best[0] + _pair_cost(*prev_states[0], t2, s2)
+            for p in range(1, len(prev_states)):
+                c = best[p] + _pair_cost(*prev_states[p], t2, s2)
+                if c < cost:
+                    choice, cost = p, c
+            step_best.append(cost)
+            step_back.append(choice)
+        best = step_best
+        back.append(step_back)
+
+    # Trace back from the cheapest final state
+    state = 0
+    for k in range(1, len(best)):
+        if best[k] < best[state]:
+            state = k
+    total = best[state]
+
+    result = chords.copy()
+    for i in range(n - 1, -1, -1):
+        if state:
+            result[i] = tritone_substitute(chords[i])
+        if i:
+            state = back[i - 1][state]
+
+    return result, float(total)
 
 
 # Common voice leading patterns in jazz
@@ -264,24 +428,21 @@ def suggest_connecting_chord(
     if direct_cost <= 2:
         return None  # Already smooth
 
-    # Try various connecting chords
-    candidates = []
+    # Try various connecting chords, keeping the first cheapest
+    best = None
+    best_cost = direct_cost
 
     # Passing diminished
     dim_root = chord1.root.transpose(1)
     dim = ChordSymbol(dim_root, ChordQuality.DIM7)
     cost_via_dim = voice_leading_cost(chord1, dim) + voice_leading_cost(dim, chord2)
-    if cost_via_dim < direct_cost:
-        candidates.append((dim, cost_via_dim))
+    if cost_via_dim < best_cost:
+        best, best_cost = dim, cost_via_dim
 
     # Secondary dominant
     v_of_2 = ChordSymbol(chord2.root.transpose(7), ChordQuality.DOM7)
     cost_via_v = voice_leading_cost(chord1, v_of_2) + voice_leading_cost(v_of_2, chord2)
-    if cost_via_v < direct_cost:
-        candidates.append((v_of_2, cost_via_v))
-
-    if candidates:
-        candidates.sort(key=lambda x: x[1])
-        return candidates[0][0]
+    if cost_via_v < best_cost:
+        best, best_cost = v_of_2, cost_via_v
 
-    return None
+    return best
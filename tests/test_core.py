@@ -4,7 +4,10 @@ import sys
 sys.path.insert(0, '/Users/madzine/Documents/JazzArchitect')
 
 from src.core.pitch import PitchClass, C, D, E, F, G, A, B, Bb, Eb, Ab
-from src.core.chord import ChordSymbol, ChordQuality, maj7, min7, dom7, hdim7
+from src.core.chord import (
+    ChordSymbol, ChordQuality, maj7, min7, dom7, hdim7, clear_chord_cache,
+    pitch_classes_batch
+)
 
 
 def test_pitch_class_basics():
@@ -101,6 +104,32 @@ def test_chord_symbol_parsing():
     print("ChordSymbol parsing: OK")
 
 
+def test_chord_symbol_parse_cache():
+    """Test that cached parses are shared, immutable and hashable"""
+    clear_chord_cache()
+    first = ChordSymbol.from_string('G7b9')
+    second = ChordSymbol.from_string('G7b9')
+    assert first == second
+    assert first is second
+    assert hash(first) == hash(ChordSymbol(first.root, first.quality, [9], {'9': 'b'}))
+
+    try:
+        first.alterations['5'] = '#'
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("alterations should be read-only")
+    assert first.alterations == {'9': 'b'}
+    assert first.extensions == (9,)
+
+    sharp_five = first.with_alterations({'5': '#'})
+    assert sharp_five.alterations == {'5': '#', '9': 'b'}
+    assert str(sharp_five) == 'G7#5b9'
+    assert first.alterations == {'9': 'b'}
+
+    print("ChordSymbol parse cache: OK")
+
+
 def test_guide_tones():
     """Test guide tone extraction (3rd and 7th)"""
     # Cmaj7: third = E (4), seventh = B (11)
@@ -121,6 +150,19 @@ def test_guide_tones():
     print("Guide tones: OK")
 
 
+def test_pitch_classes_batch():
+    """Test bulk chord-tone expansion matches per-chord expansion"""
+    chords = [maj7('C'), min7('D'), dom7('G'), hdim7('B')]
+    batch = pitch_classes_batch(
+        [c.root.value for c in chords],
+        [c.quality for c in chords]
+    )
+    for chord, pcs in zip(chords, batch):
+        assert list(pcs) == [p.value for p in chord.get_pitch_classes()]
+
+    print("Pitch classes batch: OK")
+
+
 def test_tritone_substitution():
     """Test tritone substitution"""
     g7 = dom7('G')
@@ -184,7 +226,9 @@ if __name__ == '__main__':
     test_pitch_class_transpose()
     test_chord_symbol_creation()
     test_chord_symbol_parsing()
+    test_chord_symbol_parse_cache()
     test_guide_tones()
+    test_pitch_classes_batch()
     test_tritone_substitution()
     test_transpose_chord()
     test_roman_numeral()
@@ -5,25 +5,89 @@ sys.path.insert(0, '/Users/madzine/Documents/JazzArchitect')
 
 from src.core.pitch import PitchClass
 from src.core.chord import ChordSymbol, ChordQuality, min7, dom7, maj7
-from src.style import StyleEngine, get_style, list_styles, BEBOP, MODAL
+from src.style import (
+    StyleEngine, get_style, list_styles, blend_presets, generate_batch, BEBOP, MODAL
+)
+from src.grammar.rules import create_base_grammar, NonTerminal, GrammarRule, RuleTag
 from src.grammar.generator import generate_progression, format_progression
 from src.substitution import tritone_substitute, coltrane_substitution
-from src.voiceleading import voice_leading_cost, analyze_progression
-from src.evaluation import evaluate_progression
+from src.voiceleading import (
+    voice_leading_cost, progression_voice_leading_cost, analyze_progression,
+    voice_leading_stats, optimize_progression
+)
+from src.evaluation import evaluate_progression, evaluate_batch
+
+
+# One engine per preset, shared by the generation tests
+_ENGINES = {name: StyleEngine(get_style(name)) for name in ('bebop', 'modal', 'cool', 'postbop')}
 
 
 def test_style_generation():
     """Test generation with different styles"""
     print("Testing style generation...")
 
-    for style_name in ['bebop', 'modal', 'cool', 'postbop']:
-        engine = StyleEngine(get_style(style_name))
+    for style_name, engine in _ENGINES.items():
         result = engine.generate(length=8, key='C', seed=42)
 
         assert len(result.chords) == 8
         assert result.style is not None
         print(f"  {style_name}: {' | '.join(str(c) for c in result.chords[:4])}...")
 
+    # Engines with equal styles share one cached grammar internally, but
+    # edits through the public attribute stay local to that engine
+    first, second = StyleEngine(get_style('bebop')), StyleEngine(get_style('bebop'))
+    assert first._grammar is second._grammar
+    first.grammar.get_rules(NonTerminal.D)[0].prob = 0.0
+    assert first._grammar is not second._grammar
+    assert second.grammar.get_rules(NonTerminal.D)[0].prob > 0
+
+    # Preset grammars outlive a sweep of blended styles through the cache
+    shared = StyleEngine(BEBOP)._grammar
+    for i in range(300):
+        StyleEngine(blend_presets({'bebop': 1 - i / 300, 'modal': i / 300}))
+    assert StyleEngine(get_style('bebop'))._grammar is shared
+
+    print("  OK")
+
+
+def test_batch_generation():
+    """Test reproducible batch generation across processes"""
+    print("Testing batch generation...")
+
+    serial = generate_batch(6, style='bebop', length=8, seed=7, workers=1)
+    parallel = generate_batch(6, style='bebop', length=8, seed=7, workers=2)
+
+    assert len(serial) == 6
+    assert all(len(p) == 8 for p in serial)
+    assert serial == parallel
+    print(f"  First: {' | '.join(str(c) for c in serial[0][:4])}...")
+
+    print("  OK")
+
+
+def test_grammar_sampling():
+    """Test that rule sampling follows probabilities edited in place"""
+    print("Testing grammar sampling...")
+
+    grammar = create_base_grammar()
+    grammar.normalize()
+    rules = grammar.get_rules(NonTerminal.D)
+    grammar.sample_rule(NonTerminal.D)  # warm the sampling cache
+
+    # Direct prob writes (as style_to_pcfg does) must be seen by sampling
+    for rule in rules[1:]:
+        rule.prob = 0.0
+    assert all(r is rules[0] for r in grammar.sample_many(NonTerminal.D, 200))
+    print(f"  Only rule left: {rules[0]}")
+
+    # Derived tags follow renames, also on copies; explicit tags are kept
+    rule = grammar.copy().get_rules(NonTerminal.D)[0]
+    rule.name = 'tritone_sub'
+    assert rule.tag == RuleTag.TRITONE_SUB
+    tagged = GrammarRule(NonTerminal.D, [], name='ii_v', tag=RuleTag.NONE)
+    tagged.name = 'd_terminal'
+    assert tagged.tag == RuleTag.NONE
+
     print("  OK")
 
 
@@ -68,6 +132,24 @@ def test_voice_leading():
     assert analysis.smooth_transitions >= 2
     print(f"  Smooth transitions: {analysis.smooth_transitions}/{len([dm7, g7, cmaj7])-1}")
 
+    # Single-pass stats agree with the full analysis
+    avg, smooth_ratio = voice_leading_stats([dm7, g7, cmaj7])
+    assert avg == analysis.average_cost
+    assert smooth_ratio == analysis.smooth_transitions / 2
+
+    # Summary-only analysis skips the connections but agrees on the numbers
+    summary = analyze_progression([dm7, g7, cmaj7], detail=False)
+    assert summary.connections is None
+    assert summary.total_cost == analysis.total_cost
+    assert summary.smooth_transitions == analysis.smooth_transitions
+
+    # Optimization never makes voice leading worse and reports the real cost
+    rough = [cmaj7, dom7('F#'), dm7, dom7('Db'), cmaj7]
+    optimized, cost = optimize_progression(rough)
+    assert cost <= progression_voice_leading_cost(rough)
+    assert cost == progression_voice_leading_cost(optimized)
+    print(f"  Optimized: {' | '.join(str(c) for c in optimized)} (cost {cost})")
+
     print("  OK")
 
 
@@ -83,6 +165,17 @@ def test_evaluation():
     assert 0 <= result.coherence_score <= 1
     assert result.pitch_class_entropy >= 0
 
+    # Repeat evaluations of an equal progression are served from the cache
+    assert evaluate_progression(list(chords)) is result
+    assert evaluate_progression(chords, chords[0].root) is result
+
+    # Batch evaluation matches one-at-a-time results
+    other = generate_progression(length=8, key='F', seed=7)
+    batch = evaluate_batch([chords, [], other])
+    assert batch[0] is result
+    assert batch[1] == evaluate_progression([])
+    assert batch[2] == evaluate_progression(other)
+
     print(f"  Variety: {result.variety_score:.3f}")
     print(f"  Coherence: {result.coherence_score:.3f}")
     print(f"  Overall: {result.overall_score():.3f}")
@@ -94,7 +187,7 @@ def test_blues_generation():
     """Test blues changes generation"""
     print("Testing blues generation...")
 
-    engine = StyleEngine(BEBOP)
+    engine = _ENGINES['bebop']
     blues = engine.generate_blues_changes(key='F', bars=12)
 
     assert len(blues) == 12
@@ -107,7 +200,7 @@ def test_turnaround():
     """Test turnaround generation"""
     print("Testing turnaround...")
 
-    engine = StyleEngine(BEBOP)
+    engine = _ENGINES['bebop']
     turnaround = engine.generate_turnaround(key='C')
 
     assert len(turnaround) >= 4
@@ -133,6 +226,9 @@ def test_style_blending():
     print(f"  Modal tritone prob: {modal.tritone_sub_prob}")
     print(f"  Blended tritone prob: {blended.tritone_sub_prob}")
 
+    # Blending presets by name matches pairwise blending
+    assert blend_presets({'bebop': 0.5, 'modal': 0.5}) == blended
+
     print("  OK")
 
 
@@ -157,6 +253,8 @@ if __name__ == '__main__':
     print()
 
     test_style_generation()
+    test_batch_generation()
+    test_grammar_sampling()
     test_substitutions()
     test_voice_leading()
     test_evaluation()